@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled version of sysglance's make_bar arithmetic.
+
+Optional: sysglance falls back to the pure-Python _py_bar_parts when this
+extension has not been built. The two must return identical tuples.
+"""
+
+from libc.math cimport ceil, isnan
+
+cdef int BAR_WIDTH = 30
+
+cdef list _BARS = [
+    "[" + "█" * i + "░" * (BAR_WIDTH - i) + "]" for i in range(BAR_WIDTH + 1)
+]
+
+cdef dict _LABELS = {}
+
+
+cpdef tuple bar_parts(str label, double pct, str color):
+    """Return (padded label, bar, percentage text, color) for make_bar."""
+    cdef double clamped = pct
+    cdef int whole
+    if isnan(pct):
+        # Casting NaN to int is undefined in C; fail like the Python version
+        raise ValueError("cannot convert float NaN to integer")
+    if clamped < 0.0:
+        clamped = 0.0
+    elif clamped > 100.0:
+        clamped = 100.0
+    whole = <int>ceil(clamped)
+    if whole > 85:
+        color = "red"
+    elif whole > 60:
+        color = "yellow"
+    padded = _LABELS.get(label)
+    if padded is None:
+        padded = _LABELS[label] = f"{label:<10} "
+    return padded, _BARS[<int>(BAR_WIDTH * clamped / 100)], f" {pct:5.1f}%", color
@@ -1,4 +1,6 @@
-from setuptools import setup
+import os
+
+from setuptools import Extension, setup
 
 # Read version from the module without importing it
 version = {}
@@ -8,9 +10,29 @@ with open("sysglance.py") as f:
             exec(line, version)
             break
 
+# The compiled make_bar helper is optional: it is built from the .pyx when
+# Cython is available, from the generated .c shipped in the sdist otherwise,
+# and skipped if there is no compiler (sysglance then uses pure Python).
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None and os.path.exists("_sysglance_fast.pyx"):
+    ext_modules = cythonize(["_sysglance_fast.pyx"])
+elif os.path.exists("_sysglance_fast.c"):
+    ext_modules = [Extension("_sysglance_fast", ["_sysglance_fast.c"])]
+else:
+    ext_modules = []
+for ext in ext_modules:
+    # cythonize() drops Extension(optional=...), so set it afterwards
+    ext.optional = True
+
 setup(
     name='sysglance',
     version=version['__version__'],
     py_modules=['sysglance'],
-    install_requires=['rich', 'psutil'],
+    ext_modules=ext_modules,
+    install_requires=['rich', 'psutil', 'numpy'],
+    extras_require={'gpu': ['nvidia-ml-py'], 'fast': ['orjson']},
 )
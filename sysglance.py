@@ -8,45 +8,169 @@ Author: Collective
 __version__ = '0.2.0'
 
 import argparse
+import asyncio
+import atexit
+import concurrent.futures
+import csv
+import functools
+import http.client
+import io
 import json
+import math
+import os
 import shutil
-import subprocess
+import socket
+import threading
 import time
-from datetime import datetime, timedelta
+import urllib.parse
+from typing import Callable, Optional
 
+import numpy as np
 import psutil
 from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from rich.bar import Bar
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+
+_BAR_WIDTH = 30
+
+# Every bar make_bar can draw, indexed by the number of filled cells.
+_BARS = [f"[{'█' * i}{'░' * (_BAR_WIDTH - i)}]" for i in range(_BAR_WIDTH + 1)]
+
+# Threshold color per whole percent; None keeps the caller's color. Indexed by
+# ceil(pct) so that anything strictly above 60 / 85 changes color.
+_THRESHOLD_COLORS = [None] * 61 + ["yellow"] * 25 + ["red"] * 15
+
+
+_LABEL_STYLE = Style(bold=True, color="white")
+
+# (bar, percentage) Style pair per color, so spans carry ready-made Style
+# objects instead of strings Rich would look up again at render time.
+_BAR_STYLES: dict[str, tuple[Style, Style]] = {}
+
+# Padded label text; core and GPU labels repeat on every tick.
+_LABELS: dict[str, str] = {}
+
+
+def _py_bar_parts(label: str, pct: float, color: str) -> tuple[str, str, str, str]:
+    """Return (padded label, bar, percentage text, color) for make_bar."""
+    clamped = min(max(pct, 0.0), 100.0)
+    bar = _BARS[int(_BAR_WIDTH * clamped / 100)]
+    color = _THRESHOLD_COLORS[math.ceil(clamped)] or color
+    padded = _LABELS.get(label)
+    if padded is None:
+        padded = _LABELS[label] = f"{label:<10} "
+    return padded, bar, f" {pct:5.1f}%", color
+
+
+# The string work runs once per core per tick; use the Cython build of it
+# (_sysglance_fast.pyx, compiled by setup.py when Cython is present) if any.
+try:
+    from _sysglance_fast import bar_parts as _bar_parts
+except ImportError:
+    _bar_parts = _py_bar_parts
+
 
 def make_bar(label: str, pct: float, color: str = "green") -> Text:
     """Return a colored text bar like: label [████████░░░░] 62%"""
-    width = 30
-    filled = int(width * pct / 100)
-    if pct > 85:
-        color = "red"
-    elif pct > 60:
-        color = "yellow"
-    bar = f"{'█' * filled}{'░' * (width - filled)}"
+    padded, bar, pct_text, color = _bar_parts(label, pct, color)
+    styles = _BAR_STYLES.get(color)
+    if styles is None:
+        styles = _BAR_STYLES[color] = (Style.parse(color), Style.parse(f"bold {color}"))
     return Text.assemble(
-        (f"{label:<10} ", "bold white"),
-        (f"[{bar}]", color),
-        (f" {pct:5.1f}%", f"bold {color}"),
+        (padded, _LABEL_STYLE),
+        (bar, styles[0]),
+        (pct_text, styles[1]),
     )
 
 
+# Table panels are built once and refilled every tick. Each keeps two tables
+# that take turns, so rows are only ever cleared on the one Live isn't drawing.
+_table_buffers: dict[str, list[Table]] = {}
+_table_panels: dict[str, Panel] = {}
+
+
+def _fresh_table(name: str, factory: Callable[[], Table]) -> Table:
+    """Return the idle table for *name*, emptied and ready for new rows."""
+    buffers = _table_buffers.get(name)
+    if buffers is None:
+        buffers = _table_buffers[name] = [factory(), factory()]
+    buffers.reverse()
+    table = buffers[0]
+    table.rows.clear()
+    for column in table.columns:
+        column._cells.clear()
+    return table
+
+
+def _table_panel(name: str, table: Table, title: str, border_style: str) -> Panel:
+    """Show *table* in the long-lived panel for *name*."""
+    panel = _table_panels.get(name)
+    if panel is None:
+        panel = _table_panels[name] = Panel(table, title=title, border_style=border_style)
+    panel.renderable = table
+    return panel
+
+
+_PROC_STAT = "/proc/stat"
+_HAVE_PROC_STAT = os.path.exists(_PROC_STAT)
+
+# Jiffy totals from the previous /proc/stat read; row 0 is the aggregate
+# "cpu" line and row i+1 is core i.
+_cpu_state = {"total": None, "idle": None}
+
+
+def _read_proc_stat() -> np.ndarray:
+    """Return the cpu lines of /proc/stat as an int64 array, aggregate row first."""
+    with open(_PROC_STAT, "rb") as f:
+        data = f.read()
+    rows = [line.split()[1:] for line in data.splitlines() if line.startswith(b"cpu")]
+    return np.array(rows, dtype=np.int64)
+
+
+def _cpu_percents() -> tuple[list[float], float]:
+    """Return (per-core %, overall %) busy time since the previous call.
+
+    Reads /proc/stat directly on Linux and falls back to psutil elsewhere.
+    """
+    if not _HAVE_PROC_STAT:
+        return psutil.cpu_percent(percpu=True), psutil.cpu_percent()
+    times = _read_proc_stat()
+    # user nice system idle iowait irq softirq steal; guest time is already in user/nice.
+    total = times[:, :8].sum(axis=1)
+    idle = times[:, 3] + times[:, 4]
+    prev_total, prev_idle = _cpu_state["total"], _cpu_state["idle"]
+    _cpu_state.update(total=total, idle=idle)
+    if prev_total is None or prev_total.shape != total.shape:
+        prev_total = prev_idle = np.zeros_like(total)
+    elapsed = total - prev_total
+    busy = elapsed - (idle - prev_idle)
+    pct = np.where(elapsed > 0, 100.0 * busy / np.maximum(elapsed, 1), 0.0)
+    pct = np.clip(pct, 0.0, 100.0).round(1)
+    return pct[1:].tolist(), float(pct[0])
+
+
 def cpu_panel() -> Panel:
     """Per-core CPU usage bar chart."""
     lines: list[Text] = []
-    percents = psutil.cpu_percent(percpu=True)
+    percents, avg = _cpu_percents()
     for i, pct in enumerate(percents):
         lines.append(make_bar(f"Core {i}", pct))
-    avg = psutil.cpu_percent()
     lines.append(Text(""))
     lines.append(make_bar("Average", avg, "cyan"))
     content = Text("\n").join(lines)
@@ -71,45 +195,132 @@ def mem_panel() -> Panel:
     return Panel(Text("\n").join(lines), title="[bold magenta]Memory[/]", border_style="magenta")
 
 
-def disk_panel() -> Panel:
-    """Disk usage per mount point."""
+def _new_disk_table() -> Table:
     table = Table(expand=True, show_header=True, header_style="bold yellow")
     table.add_column("Mount", style="white", no_wrap=True)
     table.add_column("Size", justify="right")
     table.add_column("Used", justify="right")
     table.add_column("Free", justify="right")
     table.add_column("%", justify="right")
-    for part in psutil.disk_partitions(all=False):
+    return table
+
+
+def _daemon_future(fn: Callable, *args, name: str) -> concurrent.futures.Future:
+    """Run fn(*args) on a new daemon thread and return a Future for its result.
+
+    For calls that may hang in the kernel or a driver: an executor's workers
+    are joined at exit, so one stuck call would keep the process from exiting.
+    """
+    fut = concurrent.futures.Future()
+
+    def run():
         try:
-            u = psutil.disk_usage(part.mountpoint)
-        except PermissionError:
+            fut.set_result(fn(*args))
+        except BaseException as exc:
+            fut.set_exception(exc)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return fut
+
+
+# statvfs() can block for seconds on a sleeping disk or a stale network mount,
+# so mounts are queried in parallel, each on a daemon thread. A mount whose
+# query is still running is not resubmitted; it just stays out of the table
+# until the call returns.
+_disk_pending: dict[str, concurrent.futures.Future] = {}
+
+
+def _disk_usages(mountpoints: list[str], timeout: float = 1) -> list[tuple]:
+    """Return (mountpoint, usage) for every mount that answers within *timeout*."""
+    futures = {}
+    for mp in mountpoints:
+        if mp not in _disk_pending:
+            _disk_pending[mp] = _daemon_future(psutil.disk_usage, mp, name="sysglance-disk")
+        futures[mp] = _disk_pending[mp]
+    concurrent.futures.wait(futures.values(), timeout=timeout)
+    usages = []
+    for mp, fut in futures.items():
+        if not fut.done():
             continue
+        del _disk_pending[mp]
+        try:
+            usages.append((mp, fut.result()))
+        except PermissionError:
+            pass
+    return usages
+
+
+def disk_panel() -> Panel:
+    """Disk usage per mount point."""
+    table = _fresh_table("disk", _new_disk_table)
+    mountpoints = [part.mountpoint for part in psutil.disk_partitions(all=False)]
+    for mountpoint, u in _disk_usages(mountpoints):
         pct = u.percent
         color = "green" if pct < 60 else ("yellow" if pct < 85 else "red")
         table.add_row(
-            part.mountpoint,
+            mountpoint,
             f"{u.total / (1 << 30):.1f}G",
             f"{u.used / (1 << 30):.1f}G",
             f"{u.free / (1 << 30):.1f}G",
             f"[{color}]{pct:.0f}%[/]",
         )
-    return Panel(table, title="[bold yellow]Disk Usage[/]", border_style="yellow")
+    return _table_panel("disk", table, "[bold yellow]Disk Usage[/]", "yellow")
 
 
-def proc_panel() -> Panel:
-    """Top 5 processes by CPU."""
+# psutil.Process objects survive between ticks so cpu_percent() has a previous
+# sample to diff against and no object is rebuilt for a long-lived PID.
+_proc_cache: dict[int, psutil.Process] = {}
+
+
+def _sample_procs() -> list[dict]:
+    """Sync the process cache with the live PID list and sample every process.
+
+    Processes seen for the first time are only primed: their first
+    cpu_percent() is always 0.0, so they are left out until the next call.
+    """
+    pids = set(psutil.pids())
+    for pid in _proc_cache.keys() - pids:
+        del _proc_cache[pid]
+    new = pids - _proc_cache.keys()
+    for pid in new:
+        try:
+            _proc_cache[pid] = psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    procs = []
+    for pid, p in list(_proc_cache.items()):
+        try:
+            # oneshot() reads /proc/<pid>/stat and friends once for all three calls
+            with p.oneshot():
+                cpu = p.cpu_percent()
+                if pid in new:
+                    continue
+                procs.append({
+                    "pid": pid,
+                    "name": p.name(),
+                    "cpu_percent": cpu,
+                    "memory_percent": p.memory_percent(),
+                })
+        except psutil.NoSuchProcess:
+            del _proc_cache[pid]
+        except psutil.AccessDenied:
+            pass
+    return procs
+
+
+def _new_proc_table() -> Table:
     table = Table(expand=True, show_header=True, header_style="bold green")
     table.add_column("PID", justify="right", width=7)
     table.add_column("Name", ratio=2)
     table.add_column("CPU%", justify="right", width=7)
     table.add_column("MEM%", justify="right", width=7)
-    procs = []
-    for p in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
-        try:
-            info = p.info
-            procs.append(info)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+    return table
+
+
+def proc_panel() -> Panel:
+    """Top 5 processes by CPU."""
+    table = _fresh_table("proc", _new_proc_table)
+    procs = _sample_procs()
     procs.sort(key=lambda x: x.get("cpu_percent") or 0, reverse=True)
     for info in procs[:5]:
         table.add_row(
@@ -118,25 +329,60 @@ def proc_panel() -> Panel:
             f"{info['cpu_percent']:.1f}",
             f"{info['memory_percent']:.1f}" if info["memory_percent"] else "-",
         )
-    return Panel(table, title="[bold green]Top Processes (CPU)[/]", border_style="green")
+    return _table_panel("proc", table, "[bold green]Top Processes (CPU)[/]", "green")
 
 
-def net_panel() -> Panel:
-    """Network I/O rates."""
+def _new_net_table() -> Table:
     table = Table(expand=True, show_header=True, header_style="bold blue")
     table.add_column("Interface", style="white")
     table.add_column("Sent", justify="right")
     table.add_column("Recv", justify="right")
+    return table
+
+
+# Byte counters from the previous net_panel call, as parallel arrays indexed
+# like "ifaces", so every interface's rate comes from one vector subtraction.
+_net_state = {
+    "ifaces": [],
+    "sent": np.zeros(0, dtype=np.int64),
+    "recv": np.zeros(0, dtype=np.int64),
+    "ts": 0.0,
+}
+
+
+def _net_rates(counters: dict) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Return (ifaces, sent, recv) in MiB/s since the previous call.
+
+    Rates are zero whenever the set of interfaces differs from last time.
+    """
+    ifaces = sorted(counters)
+    n = len(ifaces)
+    sent = np.fromiter((counters[i].bytes_sent for i in ifaces), dtype=np.int64, count=n)
+    recv = np.fromiter((counters[i].bytes_recv for i in ifaces), dtype=np.int64, count=n)
+    now = time.monotonic()
+    dt = now - _net_state["ts"]
+    if ifaces == _net_state["ifaces"] and dt > 0:
+        scale = 1.0 / (dt * (1 << 20))
+        # Counters go backwards when a NIC resets; show that as idle, not negative.
+        sent_rate = np.maximum(sent - _net_state["sent"], 0) * scale
+        recv_rate = np.maximum(recv - _net_state["recv"], 0) * scale
+    else:
+        sent_rate = recv_rate = np.zeros(n)
+    _net_state.update(ifaces=ifaces, sent=sent, recv=recv, ts=now)
+    return ifaces, sent_rate, recv_rate
+
+
+def net_panel() -> Panel:
+    """Network I/O rates."""
+    table = _fresh_table("net", _new_net_table)
     counters = psutil.net_io_counters(pernic=True)
-    for iface, io in sorted(counters.items()):
+    ifaces, sent_rate, recv_rate = _net_rates(counters)
+    for iface, up, down in zip(ifaces, sent_rate.tolist(), recv_rate.tolist()):
+        io = counters[iface]
         if io.bytes_sent == 0 and io.bytes_recv == 0:
             continue
-        table.add_row(
-            iface,
-            f"{io.bytes_sent / (1 << 20):.1f} MiB",
-            f"{io.bytes_recv / (1 << 20):.1f} MiB",
-        )
-    return Panel(table, title="[bold blue]Network I/O[/]", border_style="blue")
+        table.add_row(iface, f"{up:.2f} MiB/s", f"{down:.2f} MiB/s")
+    return _table_panel("net", table, "[bold blue]Network I/O[/]", "blue")
 
 
 def _docker_panel(msg: str) -> Panel:
@@ -148,12 +394,8 @@ def _docker_panel(msg: str) -> Panel:
     )
 
 
-def _docker_container_row(table: Table, line: str) -> None:
-    """Parse one JSON line from 'docker ps' and append a row to *table*."""
-    try:
-        c = json.loads(line)
-    except json.JSONDecodeError:
-        return
+def _docker_container_row(table: Table, c: dict) -> None:
+    """Append a row for container *c* (a 'docker ps --format json' entry) to *table*."""
     status = c.get("Status", c.get("State", ""))
     color = "green" if "Up" in status else "yellow"
     ports = c.get("Ports", "")
@@ -167,106 +409,404 @@ def _docker_container_row(table: Table, line: str) -> None:
     )
 
 
-def _docker_table(lines: list[str]) -> Panel:
-    """Build the Docker container table from parsed JSON lines."""
+def _new_docker_table() -> Table:
     table = Table(expand=True, show_header=True, header_style="bold #ff6ac1")
     table.add_column("Name", style="white", no_wrap=True, ratio=2)
     table.add_column("Image", ratio=2)
     table.add_column("Status", ratio=2)
     table.add_column("Ports", ratio=3)
+    return table
+
+
+def _docker_table(containers: list[dict]) -> Panel:
+    """Build the Docker container table from 'docker ps' style entries."""
+    table = _fresh_table("docker", _new_docker_table)
+    for c in containers:
+        _docker_container_row(table, c)
+    return _table_panel("docker", table, "[bold #ff6ac1]Docker Containers[/]", "#ff6ac1")
+
+
+# Resolved on first use and remembered: walking $PATH on every poll would
+# repeat the same stat calls, and handing subprocess the full path spares it
+# the search as well. Nothing is probed for a panel that never polls its tool.
+@functools.lru_cache(maxsize=1)
+def _docker_path() -> Optional[str]:
+    return shutil.which("docker")
+
+
+@functools.lru_cache(maxsize=1)
+def _nvidia_smi_path() -> Optional[str]:
+    return shutil.which("nvidia-smi")
+
+
+_DOCKER_PS_ARGS = ["ps", "--format", "json"]
+
+_NVIDIA_SMI_QUERY_ARGS = [
+    "--query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu",
+    "--format=csv,noheader,nounits",
+]
+
+
+async def _run_async(cmd: list[str], timeout: float = 5) -> tuple[int, str, str]:
+    """Run *cmd* without blocking the event loop; return (returncode, stdout, stderr).
+
+    The child is killed if it outlives *timeout*, and the TimeoutError propagates.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, out.decode(errors="replace"), err.decode(errors="replace")
+
+
+def _docker_result(returncode: int, stdout: str, stderr: str) -> Panel:
+    """Turn the output of 'docker ps' into a panel."""
+    if returncode != 0:
+        msg = stderr.strip().split("\n")[0] if stderr else "docker returned an error"
+        return _docker_panel(msg[:80])
+    lines = stdout.strip().splitlines()
+    if not lines or not lines[0]:
+        return _docker_panel("No running containers")
+    containers = []
     for line in lines:
-        _docker_container_row(table, line)
-    return Panel(table, title="[bold #ff6ac1]Docker Containers[/]", border_style="#ff6ac1")
+        try:
+            containers.append(_json_loads(line))
+        except json.JSONDecodeError:
+            continue
+    return _docker_table(containers)
+
+
+# docker and nvidia-smi are slow to fork and change far less often than the
+# psutil counters, so their panels are reused until *interval* seconds pass.
+_docker_cache = {"panel": None, "ts": 0.0, "interval": 10.0}
+_gpu_cache = {"panel": None, "ts": 0.0, "interval": 5.0}
+
+
+def _cache_fresh(cache: dict) -> bool:
+    """True if *cache* holds a panel younger than its refresh interval."""
+    return cache["panel"] is not None and time.monotonic() - cache["ts"] < cache["interval"]
+
+
+def _cache_store(cache: dict, panel: Panel) -> Panel:
+    """Remember *panel* in *cache* and return it."""
+    cache["panel"] = panel
+    cache["ts"] = time.monotonic()
+    return panel
 
 
-def docker_panel() -> Panel:
-    """Running Docker containers via 'docker ps'."""
-    if not shutil.which("docker"):
+async def _query_docker_async() -> Panel:
+    docker = _docker_path()
+    if not docker:
         return _docker_panel("docker not found in PATH")
     try:
-        result = subprocess.run(
-            ["docker", "ps", "--format", "json"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode != 0:
-            msg = result.stderr.strip().split("\n")[0] if result.stderr else "docker returned an error"
-            return _docker_panel(msg[:80])
-        lines = result.stdout.strip().splitlines()
-        if not lines or not lines[0]:
-            return _docker_panel("No running containers")
-        return _docker_table(lines)
+        return _docker_result(*await _run_async([docker, *_DOCKER_PS_ARGS]))
     except Exception:
         return _docker_panel("Could not query Docker")
 
 
-def gpu_panel() -> Panel:
-    """NVIDIA GPU utilization via nvidia-smi."""
-    if not shutil.which("nvidia-smi"):
-        return Panel(
-            Text("No GPU detected (nvidia-smi not found)", style="dim italic"),
-            title="[bold red]GPU Usage[/]",
-            border_style="red",
+_DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Only events that change what 'docker ps' would print.
+_DOCKER_EVENTS = {"type": ["container"], "event": ["start", "die", "pause", "unpause", "rename"]}
+
+# Running containers mirrored from the engine socket by the watcher thread,
+# in the same shape as 'docker ps --format json' entries. "live" is True while
+# the mirror is current; otherwise docker_panel_async falls back to 'docker ps'.
+# After the socket fails, the watcher is restarted no earlier than "retry_at",
+# waiting twice as long after each failure that never got a list back.
+_docker_state = {
+    "thread": None, "live": False, "containers": [], "retry_at": 0.0, "backoff": 1.0,
+}
+_DOCKER_RETRY_MIN = 1.0
+_DOCKER_RETRY_MAX = 60.0
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to a Unix domain socket instead of TCP."""
+
+    def __init__(self, socket_path: str, timeout: float = 5):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def _docker_get(path: str, timeout: float = 5) -> http.client.HTTPResponse:
+    """GET *path* from the Docker engine API, raising OSError unless it answers 200."""
+    conn = _UnixHTTPConnection(_DOCKER_SOCKET, timeout)
+    conn.request("GET", path, headers={"Connection": "close"})
+    resp = conn.getresponse()
+    if resp.status != 200:
+        resp.close()
+        raise OSError(f"docker API {path} returned HTTP {resp.status}")
+    return resp
+
+
+def _docker_ports(ports: list[dict]) -> str:
+    """Format /containers/json port bindings the way 'docker ps' prints them."""
+    out = []
+    for p in ports:
+        private = f"{p.get('PrivatePort')}/{p.get('Type', 'tcp')}"
+        if p.get("PublicPort"):
+            ip = p.get("IP", "0.0.0.0")
+            host = f"[{ip}]" if ":" in ip else ip
+            out.append(f"{host}:{p['PublicPort']}->{private}")
+        else:
+            out.append(private)
+    return ", ".join(out)
+
+
+def _docker_list() -> list[dict]:
+    """Running containers from GET /containers/json, shaped like 'docker ps' entries."""
+    with _docker_get("/containers/json") as resp:
+        containers = _json_loads(resp.read())
+    return [
+        {
+            "Names": ",".join(n.lstrip("/") for n in c.get("Names") or []),
+            "Image": c.get("Image", "?"),
+            "Status": c.get("Status", c.get("State", "")),
+            "Ports": _docker_ports(c.get("Ports") or []),
+        }
+        for c in containers
+    ]
+
+
+def _docker_watch_window(since: int, until: int) -> None:
+    """Load the container list, then reload it on every container event until *until*.
+
+    The engine ends the /events stream itself once *until* passes.
+    """
+    _docker_state["containers"] = _docker_list()
+    _docker_state["live"] = True
+    _docker_state["backoff"] = _DOCKER_RETRY_MIN
+    query = urllib.parse.urlencode({
+        "since": since, "until": until, "filters": json.dumps(_DOCKER_EVENTS),
+    })
+    with _docker_get(f"/events?{query}", timeout=max(until - time.time(), 0) + 5) as events:
+        for line in events:
+            if line.strip():
+                _docker_state["containers"] = _docker_list()
+
+
+def _docker_watch() -> None:
+    """Mirror running containers from the engine socket until it stops answering.
+
+    Events are read in windows of one docker interval; every window starts
+    with a fresh list so relative times like 'Up 5 minutes' stay current.
+    """
+    since = int(time.time())
+    try:
+        while True:
+            until = int(time.time() + _docker_cache["interval"]) + 1
+            _docker_watch_window(since, until)
+            since = until
+    except (OSError, http.client.HTTPException, ValueError):
+        pass
+    finally:
+        _docker_state["live"] = False
+        backoff = _docker_state["backoff"]
+        _docker_state["retry_at"] = time.monotonic() + backoff
+        _docker_state["backoff"] = min(backoff * 2, _DOCKER_RETRY_MAX)
+        _docker_state["thread"] = None
+
+
+def _docker_uses_local_socket() -> bool:
+    """True unless DOCKER_HOST or a non-default docker context points the CLI elsewhere."""
+    if "DOCKER_HOST" in os.environ:
+        return False
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context is None:
+        config_dir = os.environ.get("DOCKER_CONFIG") or os.path.expanduser("~/.docker")
+        try:
+            with open(os.path.join(config_dir, "config.json"), "rb") as f:
+                context = _json_loads(f.read()).get("currentContext")
+        except (OSError, ValueError, AttributeError):
+            context = None
+    return context in (None, "", "default")
+
+
+def _docker_watch_start() -> None:
+    """Start the socket watcher if it isn't running, unless the CLI would talk to another engine."""
+    if _docker_state["thread"] is not None or time.monotonic() < _docker_state["retry_at"]:
+        return
+    if not _docker_uses_local_socket() or not os.path.exists(_DOCKER_SOCKET):
+        return
+    thread = threading.Thread(target=_docker_watch, name="sysglance-docker", daemon=True)
+    _docker_state["thread"] = thread
+    thread.start()
+
+
+def _docker_mirror_panel() -> Panel:
+    containers = _docker_state["containers"]
+    if not containers:
+        return _docker_panel("No running containers")
+    return _docker_table(containers)
+
+
+async def docker_panel_async() -> Panel:
+    """Running Docker containers, mirrored from the engine socket or via 'docker ps'."""
+    if _docker_state["live"]:
+        return _docker_mirror_panel()
+    if _cache_fresh(_docker_cache):
+        return _docker_cache["panel"]
+    return _cache_store(_docker_cache, await _query_docker_async())
+
+
+def _gpu_message(msg: str, style: str = "dim italic") -> Panel:
+    """Wrap a short message in a GPU-themed panel."""
+    return Panel(Text(msg, style=style), title="[bold red]GPU Usage[/]", border_style="red")
+
+
+def _gpu_rows_panel(rows: list[tuple]) -> Panel:
+    """Render (index, name, util %, MiB used, MiB total, °C) rows as the GPU panel."""
+    lines: list[Text] = []
+    for idx, name, util, mem_used, mem_total, temp in rows:
+        lines.append(make_bar(f"GPU {idx}", float(util)))
+        lines.append(
+            Text(
+                f"           {name}  |  {mem_used}/{mem_total} MiB  |  {temp}°C",
+                style="dim",
+            )
         )
+        lines.append(Text(""))
+    if not lines:
+        return _gpu_message("No GPU data returned")
+    content = Text("\n").join(lines)
+    return Panel(content, title="[bold red]GPU Usage[/]", border_style="red")
+
+
+def _gpu_result(returncode: int, stdout: str) -> Panel:
+    """Turn the CSV output of 'nvidia-smi --query-gpu' into a panel."""
+    if returncode != 0:
+        return _gpu_message("nvidia-smi returned an error", "bold red")
+    rows = [
+        parts[:6]
+        for parts in csv.reader(io.StringIO(stdout), skipinitialspace=True)
+        if len(parts) >= 6
+    ]
+    return _gpu_rows_panel(rows)
+
+
+# NVML is initialised on first use and kept open for the life of the process;
+# "ready" stays None until then, and False if pynvml or the driver is missing.
+# "seen" holds, per device, the timestamp of the last utilization sample read.
+_nvml = {"ready": None, "handles": [], "seen": []}
+
+
+def _nvml_ready() -> bool:
+    """Initialise NVML once; True if GPUs can be queried in-process."""
+    if _nvml["ready"] is None:
+        _nvml["ready"] = False
+        if pynvml is None:
+            return False
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            return False
+        # Once initialised, NVML is shut down at exit even if enumeration fails
+        atexit.register(pynvml.nvmlShutdown)
+        try:
+            count = pynvml.nvmlDeviceGetCount()
+            _nvml["handles"] = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(count)]
+        except pynvml.NVMLError:
+            return False
+        _nvml["seen"] = [0] * count
+        _nvml["ready"] = True
+    return _nvml["ready"]
+
+
+def _nvml_utilization(idx: int, handle) -> float:
+    """Mean utilization of the NVML samples since the last poll, or the instantaneous reading."""
+    # One call drains the driver's sample buffer from this device's cursor
     try:
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
+        _, samples = pynvml.nvmlDeviceGetSamples(
+            handle, pynvml.NVML_GPU_UTILIZATION_SAMPLES, _nvml["seen"][idx]
         )
-        if result.returncode != 0:
-            return Panel(
-                Text("nvidia-smi returned an error", style="bold red"),
-                title="[bold red]GPU Usage[/]",
-                border_style="red",
-            )
-        lines: list[Text] = []
-        for row in result.stdout.strip().splitlines():
-            parts = [p.strip() for p in row.split(",")]
-            if len(parts) < 6:
-                continue
-            idx, name, util_pct, mem_used, mem_total, temp = parts
-            util = float(util_pct)
-            lines.append(make_bar(f"GPU {idx}", util))
-            lines.append(
-                Text(
-                    f"           {name}  |  {mem_used}/{mem_total} MiB  |  {temp}°C",
-                    style="dim",
-                )
-            )
-            lines.append(Text(""))
-        if not lines:
-            return Panel(
-                Text("No GPU data returned", style="dim italic"),
-                title="[bold red]GPU Usage[/]",
-                border_style="red",
-            )
-        content = Text("\n").join(lines)
-        return Panel(content, title="[bold red]GPU Usage[/]", border_style="red")
+    except pynvml.NVMLError:
+        samples = None
+    if not samples:
+        return pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+    _nvml["seen"][idx] = max(s.timeStamp for s in samples)
+    return sum(s.sampleValue.uiVal for s in samples) / len(samples)
+
+
+def _query_gpu_nvml() -> Panel:
+    """Build the GPU panel from direct NVML calls instead of forking nvidia-smi."""
+    rows = []
+    try:
+        for idx, handle in enumerate(_nvml["handles"]):
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode()
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            rows.append((
+                idx,
+                name,
+                _nvml_utilization(idx, handle),
+                mem.used >> 20,
+                mem.total >> 20,
+                pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+            ))
+    except pynvml.NVMLError:
+        return _gpu_message("NVML query failed", "bold red")
+    return _gpu_rows_panel(rows)
+
+
+def _gpu_nvml_panel() -> Optional[Panel]:
+    """The GPU panel read through NVML, or None when NVML can't be used."""
+    return _query_gpu_nvml() if _nvml_ready() else None
+
+
+async def _query_gpu_async() -> Panel:
+    nvidia_smi = _nvidia_smi_path()
+    if not nvidia_smi:
+        return _gpu_message("No GPU detected (nvidia-smi not found)")
+    try:
+        returncode, stdout, _ = await _run_async([nvidia_smi, *_NVIDIA_SMI_QUERY_ARGS])
+        return _gpu_result(returncode, stdout)
     except Exception:
-        return Panel(
-            Text("No GPU detected", style="dim italic"),
-            title="[bold red]GPU Usage[/]",
-            border_style="red",
-        )
+        return _gpu_message("No GPU detected")
+
+
+async def gpu_panel_async() -> Panel:
+    """NVIDIA GPU utilization via NVML, or nvidia-smi when pynvml is unavailable."""
+    if _cache_fresh(_gpu_cache):
+        return _gpu_cache["panel"]
+    # nvmlInit can take many seconds on a cold driver and every NVML call
+    # blocks in C, so the NVML path runs on a daemon thread that can't hold
+    # up the event loop or interpreter exit.
+    panel = await asyncio.wrap_future(_daemon_future(_gpu_nvml_panel, name="sysglance-nvml"))
+    if panel is None:
+        panel = await _query_gpu_async()
+    return _cache_store(_gpu_cache, panel)
+
+
+# Boot time never changes while we run, so read it once rather than per tick.
+_BOOT_TIME = psutil.boot_time()
+
+_DIM = Style(dim=True)
+_DIM_ITALIC = Style(dim=True, italic=True)
 
 
 def header_panel() -> Panel:
     """Clock and uptime."""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    boot = datetime.fromtimestamp(psutil.boot_time())
-    up = datetime.now() - boot
-    days, rem = divmod(int(up.total_seconds()), 86400)
+    now = time.strftime("%Y-%m-%d %H:%M:%S")
+    days, rem = divmod(int(time.time() - _BOOT_TIME), 86400)
     hours, rem = divmod(rem, 3600)
     mins, _ = divmod(rem, 60)
     upstr = f"{days}d {hours}h {mins}m"
     txt = Text.assemble(
-        ("  ⏰ ", ""), (now, "bold white"), ("    ⬆ up ", "dim"), (upstr, "bold white"),
-        ("    📊 sysglance", "dim italic"),
+        ("  ⏰ ", ""), (now, _LABEL_STYLE), ("    ⬆ up ", _DIM), (upstr, _LABEL_STYLE),
+        ("    📊 sysglance", _DIM_ITALIC),
     )
     return Panel(txt, style="on grey11", height=3)
 
@@ -298,16 +838,139 @@ def build_layout() -> Layout:
     return layout
 
 
+# Panels that only read psutil counters; they run on the panel pool so they
+# overlap with each other and with the awaited docker/nvidia-smi subprocesses.
+_PSUTIL_PANELS = (
+    ("header", header_panel),
+    ("cpu", cpu_panel),
+    ("mem", mem_panel),
+    ("disk", disk_panel),
+    ("proc", proc_panel),
+    ("net", net_panel),
+)
+
+
+_SUBPROCESS_PANELS = (
+    ("docker", docker_panel_async),
+    ("gpu", gpu_panel_async),
+)
+
+# A bordered panel needs three rows to show a single line of content.
+_MIN_PANEL_HEIGHT = 3
+
+_HIDDEN = Text("…hidden…", style="dim italic")
+
+
+def _shown(layout: Layout, name: str) -> bool:
+    """False if the last render left panel *name* too short to show content.
+
+    Layout re-measures on every render, so this follows terminal resizes.
+    Before the first render every panel counts as shown.
+    """
+    rendered = layout.map.get(layout[name])
+    return rendered is None or rendered.region.height >= _MIN_PANEL_HEIGHT
+
+
+# How long a refresh waits for its collectors. One that takes longer keeps
+# its previous content on screen and is swapped in whenever it finishes.
+_TICK_BUDGET = 2.0
+
+_panel_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="sysglance-panel",
+)
+
+# Collectors that are still running, by panel name; a panel is not collected
+# again until its previous collector has finished.
+_inflight: dict[str, object] = {}
+
+
+def _apply_panel(layout: Layout, name: str, fut) -> None:
+    """Done-callback that shows a collector's panel as soon as it finishes."""
+    _inflight.pop(name, None)
+    if not fut.cancelled():
+        layout[name].update(fut.result())
+
+
+async def refresh_panels_async(
+    layout: Layout, budget: Optional[float] = _TICK_BUDGET, names: Optional[set] = None,
+) -> None:
+    """Update every panel (or just *names*), collecting them concurrently.
+
+    Each panel updates the moment its collector finishes. The call returns
+    once all are done or after *budget* seconds; the rest update later.
+    Panels with no room to draw are not collected at all.
+    """
+    loop = asyncio.get_running_loop()
+    collectors = [(name, functools.partial(loop.run_in_executor, _panel_pool, fn))
+                  for name, fn in _PSUTIL_PANELS]
+    collectors += [(name, lambda fn=fn: asyncio.ensure_future(fn()))
+                   for name, fn in _SUBPROCESS_PANELS]
+    started = []
+    for name, start in collectors:
+        if names is not None and name not in names:
+            continue
+        if not _shown(layout, name):
+            layout[name].update(_HIDDEN)
+        elif name not in _inflight:
+            fut = _inflight[name] = start()
+            fut.add_done_callback(functools.partial(_apply_panel, layout, name))
+            started.append(fut)
+    if started:
+        await asyncio.wait(started, timeout=budget)
+
+
 def refresh_panels(layout: Layout) -> None:
-    """Update every panel in the layout."""
-    layout["header"].update(header_panel())
-    layout["cpu"].update(cpu_panel())
-    layout["mem"].update(mem_panel())
-    layout["disk"].update(disk_panel())
-    layout["proc"].update(proc_panel())
-    layout["net"].update(net_panel())
-    layout["docker"].update(docker_panel())
-    layout["gpu"].update(gpu_panel())
+    """Blocking refresh_panels_async() for --once; waits for every panel."""
+    asyncio.run(refresh_panels_async(layout, budget=None))
+
+
+# Seconds between collections of each panel in the live dashboard. docker
+# and gpu are cheap to ask every second: their panels come from the socket
+# mirror, NVML, or a cache that only re-forks every --docker/--gpu-interval.
+_PANEL_INTERVALS = {
+    "header": 1.0,
+    "cpu": 1.0,
+    "mem": 1.0,
+    "net": 1.0,
+    "docker": 1.0,
+    "gpu": 1.0,
+    "proc": 2.0,
+    "disk": 5.0,
+}
+
+# Live redraws on its own thread at this rate, independent of collection.
+_RENDER_HZ = 10
+
+
+def _due_panels(next_due: dict[str, float], now: float) -> set:
+    """Return the panels whose collection is due and schedule their next one."""
+    due = {name for name, at in next_due.items() if at <= now}
+    for name in due:
+        next_due[name] = now + _PANEL_INTERVALS[name]
+    return due
+
+
+async def _live_loop(layout: Layout, console: Console) -> None:
+    next_due = dict.fromkeys(_PANEL_INTERVALS, 0.0)
+    budget = min(_PANEL_INTERVALS.values())
+    with Live(layout, console=console, refresh_per_second=_RENDER_HZ, screen=True):
+        while True:
+            # Only the live view can use the socket mirror; --once never starts it
+            _docker_watch_start()
+            due = _due_panels(next_due, time.monotonic())
+            await refresh_panels_async(layout, budget=budget, names=due)
+            await asyncio.sleep(max(min(next_due.values()) - time.monotonic(), 0.0))
+
+
+def _positive_seconds(value: str) -> float:
+    """argparse type for intervals: a finite number of seconds above zero."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number of seconds, got {value!r}")
+    return seconds
 
 
 def parse_args() -> argparse.Namespace:
@@ -317,29 +980,45 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="print a single snapshot and exit instead of live-updating",
     )
+    parser.add_argument(
+        "--docker-interval",
+        type=_positive_seconds,
+        default=10.0,
+        metavar="SECONDS",
+        help="seconds between 'docker ps' polls, or between container list reloads "
+        "when mirroring the Docker socket (default: 10)",
+    )
+    parser.add_argument(
+        "--gpu-interval",
+        type=_positive_seconds,
+        default=5.0,
+        metavar="SECONDS",
+        help="seconds between GPU reads via NVML or nvidia-smi (default: 5)",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
+def main() -> int:
     args = parse_args()
+    _docker_cache["interval"] = args.docker_interval
+    _gpu_cache["interval"] = args.gpu_interval
     console = Console()
     layout = build_layout()
-    # prime cpu_percent so first read isn't 0
-    psutil.cpu_percent(percpu=True)
-    for p in psutil.process_iter(["cpu_percent"]):
-        pass
-    time.sleep(0.5)
 
     if args.once:
+        # A snapshot has no later tick to diff against, so take a first
+        # sample of the delta-based counters and let a little time pass.
+        _cpu_percents()
+        _sample_procs()
+        _net_rates(psutil.net_io_counters(pernic=True))
+        time.sleep(0.5)
         refresh_panels(layout)
         console.print(layout)
-        return
+        return 0
 
-    with Live(layout, console=console, refresh_per_second=2, screen=True):
-        while True:
-            refresh_panels(layout)
-            time.sleep(2)
+    asyncio.run(_live_loop(layout, console))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -1,17 +1,113 @@
 """Unit tests for sysglance.py — GPU fallback, --once arg parsing, color thresholds,
 panel return types, and layout structure."""
 
-import subprocess
+import asyncio
+import contextlib
+import http.server
+import io
+import json
+import os
+import socketserver
 import sys
+import tempfile
+import threading
 import time
 from collections import namedtuple
 from unittest import mock
 
+import psutil
 import pytest
 
 import sysglance
+from rich.console import Console
 from rich.layout import Layout
 from rich.panel import Panel
+from rich.style import Style
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch):
+    """Start every test with empty collector caches."""
+    for cache in (sysglance._docker_cache, sysglance._gpu_cache):
+        monkeypatch.setitem(cache, "panel", None)
+        monkeypatch.setitem(cache, "ts", 0.0)
+    monkeypatch.setattr(sysglance, "_proc_cache", {})
+    monkeypatch.setattr(sysglance, "_disk_pending", {})
+    monkeypatch.setattr(sysglance, "_inflight", {})
+    monkeypatch.setattr(sysglance, "_DOCKER_SOCKET", "/nonexistent/docker.sock")
+    # Keep the developer's own docker CLI settings out of the socket-mirror checks
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    monkeypatch.setenv("DOCKER_CONFIG", "/nonexistent/docker-config")
+    monkeypatch.setattr(sysglance, "_docker_state", {
+        "thread": None, "live": False, "containers": [], "retry_at": 0.0, "backoff": 1.0,
+    })
+    # CPU tests go through psutil unless they opt into a fake /proc/stat.
+    monkeypatch.setattr(sysglance, "_HAVE_PROC_STAT", False)
+    monkeypatch.setattr(sysglance, "_cpu_state", {"total": None, "idle": None})
+    # Tests exercise the nvidia-smi path unless they opt into a fake NVML.
+    monkeypatch.setattr(sysglance, "_nvml", {"ready": False, "handles": [], "seen": []})
+    sysglance._docker_path.cache_clear()
+    sysglance._nvidia_smi_path.cache_clear()
+    monkeypatch.setattr(sysglance, "_net_state", {
+        "ifaces": [],
+        "sent": sysglance.np.zeros(0, dtype=sysglance.np.int64),
+        "recv": sysglance.np.zeros(0, dtype=sysglance.np.int64),
+        "ts": 0.0,
+    })
+
+
+@pytest.fixture(autouse=True)
+def _no_syscalls(monkeypatch):
+    """Stand in for psutil and child processes so no test reads /proc or forks.
+
+    Tests override individual psutil functions with mock.patch as before; an
+    unpatched create_subprocess_exec fails instead of running a real tool.
+    """
+    fake = mock.MagicMock(spec=psutil)
+    # Keep the real exception classes so except clauses still match
+    fake.NoSuchProcess = psutil.NoSuchProcess
+    fake.AccessDenied = psutil.AccessDenied
+    fake.cpu_percent.side_effect = _fake_cpu
+    fake.virtual_memory.return_value = _VM_16G
+    fake.swap_memory.return_value = _SWAP_4G
+    fake.disk_partitions.return_value = [_ROOT_PART]
+    fake.disk_usage.return_value = _USAGE_500G
+    fake.pids.return_value = []
+    fake.Process.side_effect = psutil.NoSuchProcess
+    fake.net_io_counters.return_value = {}
+    monkeypatch.setattr(sysglance, "psutil", fake)
+    monkeypatch.setattr(sysglance.asyncio, "create_subprocess_exec",
+                        mock.AsyncMock(side_effect=AssertionError("unmocked create_subprocess_exec")))
+
+
+def _no_tools(docker=None, nvidia_smi=None):
+    """Patch the resolved docker / nvidia-smi paths (both absent by default)."""
+    return mock.patch.multiple(
+        "sysglance",
+        _docker_path=mock.Mock(return_value=docker),
+        _nvidia_smi_path=mock.Mock(return_value=nvidia_smi),
+    )
+
+
+def _fake_exec(returncode=0, stdout="", stderr="", hang=False):
+    """Return an AsyncMock standing in for asyncio.create_subprocess_exec.
+
+    With *hang*, the child never answers and communicate() times out.
+    """
+    proc = mock.MagicMock()
+    proc.returncode = returncode
+    if hang:
+        proc.communicate = mock.AsyncMock(side_effect=asyncio.TimeoutError)
+        proc.wait = mock.AsyncMock(return_value=-9)
+    else:
+        proc.communicate = mock.AsyncMock(return_value=(stdout.encode(), stderr.encode()))
+    return mock.AsyncMock(return_value=proc)
+
+
+def _collect(panel_async):
+    """Run one async panel collector to completion and return its panel."""
+    return asyncio.run(panel_async())
 
 
 # ---------------------------------------------------------------------------
@@ -21,59 +117,58 @@ from rich.panel import Panel
 class TestMakeBarColorThresholds:
     """make_bar should pick green ≤60 %, yellow 61-85 %, red >85 %."""
 
-    def test_low_usage_green(self):
-        text = sysglance.make_bar("Test", 30.0)
-        # default color should remain green (not overridden)
-        spans = text._spans
-        rendered = text.plain
-        assert "30.0%" in rendered
-        # No yellow or red override should have happened; color stays green
-        style_strs = [str(s.style) for s in spans]
-        assert any("green" in s for s in style_strs)
-        assert not any("yellow" in s for s in style_strs)
-        assert not any("red" in s for s in style_strs)
-
-    def test_boundary_60_stays_green(self):
-        text = sysglance.make_bar("CPU", 60.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("green" in s for s in style_strs)
-        assert not any("yellow" in s for s in style_strs)
-
-    def test_above_60_yellow(self):
-        text = sysglance.make_bar("CPU", 61.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("yellow" in s for s in style_strs)
-
-    def test_boundary_85_stays_yellow(self):
-        text = sysglance.make_bar("MEM", 85.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("yellow" in s for s in style_strs)
-        assert not any("red" in s for s in style_strs)
-
-    def test_above_85_red(self):
-        text = sysglance.make_bar("MEM", 86.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("red" in s for s in style_strs)
-
-    def test_zero_percent_green(self):
-        text = sysglance.make_bar("Idle", 0.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("green" in s for s in style_strs)
-
-    def test_100_percent_red(self):
-        text = sysglance.make_bar("Full", 100.0)
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("red" in s for s in style_strs)
+    @pytest.mark.parametrize("label,pct,color,expected,forbidden", [
+        ("Test", 30.0, "green", "green", ("yellow", "red")),
+        ("CPU", 60.0, "green", "green", ("yellow",)),
+        ("CPU", 60.5, "green", "yellow", ()),
+        ("CPU", 61.0, "green", "yellow", ()),
+        ("MEM", 85.0, "green", "yellow", ("red",)),
+        ("CPU", 85.1, "green", "red", ()),
+        ("MEM", 86.0, "green", "red", ()),
+        ("Idle", 0.0, "green", "green", ()),
+        ("Full", 100.0, "green", "red", ()),
+        # Thresholds override a caller-supplied color
+        ("X", 90.0, "cyan", "red", ()),
+    ])
+    def test_threshold(self, label, pct, color, expected, forbidden):
+        text = sysglance.make_bar(label, pct, color=color)
+        joined = " ".join(str(s.style) for s in text._spans).lower()
+        assert expected in joined
+        for other in forbidden:
+            assert other not in joined
 
     def test_bar_label_present(self):
         text = sysglance.make_bar("Swap", 42.0)
         assert "Swap" in text.plain
+        assert "42.0%" in text.plain
 
-    def test_custom_default_color_overridden_by_threshold(self):
-        """Even if caller passes color='cyan', thresholds still override."""
-        text = sysglance.make_bar("X", 90.0, color="cyan")
-        style_strs = [str(s.style) for s in text._spans]
-        assert any("red" in s for s in style_strs)
+    def test_spans_carry_style_objects(self):
+        text = sysglance.make_bar("Core 0", 70.0)
+        styles = [s.style for s in text._spans]
+        assert all(isinstance(style, Style) for style in styles)
+        assert styles[1] is sysglance.make_bar("Core 1", 75.0)._spans[1].style
+
+    def test_plain_text_layout(self):
+        text = sysglance.make_bar("RAM", 50.0)
+        assert text.plain == "RAM        [" + "█" * 15 + "░" * 15 + "]  50.0%"
+
+    def test_out_of_range_clamped(self):
+        assert "[" + "█" * 30 + "]" in sysglance.make_bar("Hot", 130.0).plain
+        assert "[" + "░" * 30 + "]" in sysglance.make_bar("Odd", -5.0).plain
+
+    @pytest.mark.parametrize("pct", [
+        -5.0, 0.0, 3.3, 60.0, 60.01, 85.0, 85.1, 99.99, 100.0, 130.0, float("inf"), float("-inf"),
+    ])
+    def test_compiled_bar_parts_match_python(self, pct):
+        fast = pytest.importorskip("_sysglance_fast")
+        assert fast.bar_parts("Core 12", pct, "cyan") == sysglance._py_bar_parts("Core 12", pct, "cyan")
+
+    def test_compiled_bar_parts_reject_nan_like_python(self):
+        fast = pytest.importorskip("_sysglance_fast")
+        with pytest.raises(ValueError):
+            sysglance._py_bar_parts("Core 0", float("nan"), "green")
+        with pytest.raises(ValueError):
+            fast.bar_parts("Core 0", float("nan"), "green")
 
 
 # ---------------------------------------------------------------------------
@@ -100,79 +195,213 @@ class TestParseArgs:
 
 
 # ---------------------------------------------------------------------------
-# GPU detection fallback (gpu_panel)
+# GPU detection fallback (gpu_panel_async)
 # ---------------------------------------------------------------------------
 
-class TestGpuPanelFallback:
-    """gpu_panel should degrade gracefully when nvidia-smi is absent or fails."""
+# _fake_exec arguments for each nvidia-smi outcome.
+_SMI_OK = {"stdout": "0, NVIDIA RTX 4090, 45, 2048, 24576, 55"}
+_SMI_EMPTY = {}
+_SMI_ERR = {"returncode": 1, "stderr": "fail"}
 
-    def test_no_nvidia_smi_on_path(self):
-        """When nvidia-smi is not found on PATH, show friendly fallback."""
-        with mock.patch("sysglance.shutil.which", return_value=None):
-            panel = sysglance.gpu_panel()
-        rendered = panel.renderable.plain
-        assert "No GPU detected" in rendered
-        assert "nvidia-smi not found" in rendered
 
-    def test_nvidia_smi_returns_error_code(self):
-        """When nvidia-smi exits non-zero, show error message."""
-        fake_result = subprocess.CompletedProcess(
-            args=["nvidia-smi"], returncode=1, stdout="", stderr="fail"
-        )
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"):
-            with mock.patch("sysglance.subprocess.run", return_value=fake_result):
-                panel = sysglance.gpu_panel()
-        rendered = panel.renderable.plain
-        assert "error" in rendered.lower()
+_SMI_PATH = "/usr/bin/nvidia-smi"
 
-    def test_nvidia_smi_returns_empty_output(self):
-        """When nvidia-smi returns success but no data rows, show fallback."""
-        fake_result = subprocess.CompletedProcess(
-            args=["nvidia-smi"], returncode=0, stdout="", stderr=""
-        )
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"):
-            with mock.patch("sysglance.subprocess.run", return_value=fake_result):
-                panel = sysglance.gpu_panel()
-        rendered = panel.renderable.plain
-        assert "No GPU data returned" in rendered
-
-    def test_nvidia_smi_timeout_exception(self):
-        """When nvidia-smi times out, show generic fallback."""
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"):
-            with mock.patch(
-                "sysglance.subprocess.run",
-                side_effect=subprocess.TimeoutExpired(cmd="nvidia-smi", timeout=5),
-            ):
-                panel = sysglance.gpu_panel()
-        rendered = panel.renderable.plain
-        assert "No GPU detected" in rendered
 
-    def test_nvidia_smi_success(self):
-        """When nvidia-smi returns valid CSV, panel should contain GPU info."""
-        csv_line = "0, NVIDIA RTX 4090, 45, 2048, 24576, 55"
-        fake_result = subprocess.CompletedProcess(
-            args=["nvidia-smi"], returncode=0, stdout=csv_line, stderr=""
+class TestGpuPanelFallback:
+    """gpu_panel_async should degrade gracefully when nvidia-smi is absent or fails."""
+
+    @pytest.mark.parametrize("path,exec_kwargs,expected", [
+        # Not on PATH: nothing may be forked
+        (None, None, ("No GPU detected", "nvidia-smi not found")),
+        (_SMI_PATH, _SMI_ERR, ("nvidia-smi returned an error",)),
+        (_SMI_PATH, _SMI_EMPTY, ("No GPU data returned",)),
+        (_SMI_PATH, {"hang": True}, ("No GPU detected",)),
+        (_SMI_PATH, _SMI_OK, ("GPU 0", "RTX 4090", "55°C")),
+        # Every CSV row becomes its own GPU bar; blank lines are ignored
+        (_SMI_PATH, {"stdout": (
+            "0, NVIDIA A100-SXM4-80GB, 97, 80000, 81920, 71\n"
+            "\n"
+            "1, NVIDIA A100-SXM4-80GB, 3, 512, 81920, 34\n"
+        )}, ("GPU 0", "GPU 1", "512/81920 MiB", "34°C")),
+        # Rows with fewer than 6 CSV fields are silently skipped
+        (_SMI_PATH, {"stdout": "0, NVIDIA RTX 4090, 45"}, ("No GPU data returned",)),
+    ], ids=["not-found", "error-code", "empty", "timeout", "success", "multi-gpu", "malformed"])
+    def test_gpu_panel_fallback(self, path, exec_kwargs, expected):
+        spawn = (_fake_exec(**exec_kwargs) if exec_kwargs is not None
+                 else mock.AsyncMock(side_effect=AssertionError("forked")))
+        with mock.patch("sysglance._nvidia_smi_path", return_value=path), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            rendered = _collect(sysglance.gpu_panel_async).renderable.plain
+        for text in expected:
+            assert text in rendered
+        if path is None:
+            spawn.assert_not_called()
+
+    def test_query_argv(self):
+        spawn = _fake_exec(**_SMI_OK)
+        with mock.patch("sysglance._nvidia_smi_path", return_value=_SMI_PATH), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            _collect(sysglance.gpu_panel_async)
+        # Field order must match the CSV the parser expects; no XML (-q -x) query
+        assert spawn.call_args.args == (
+            _SMI_PATH,
+            "--query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu",
+            "--format=csv,noheader,nounits",
         )
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"):
-            with mock.patch("sysglance.subprocess.run", return_value=fake_result):
-                panel = sysglance.gpu_panel()
-        # The panel renderable is a joined Text — check the plain string
+
+
+# ---------------------------------------------------------------------------
+# In-process NVML path (pynvml)
+# ---------------------------------------------------------------------------
+
+class _FakeNVMLError(Exception):
+    pass
+
+
+def _fake_pynvml(gpus):
+    """Return a stand-in pynvml module exposing *gpus* as (name, util, used, total, temp)."""
+    nvml = mock.MagicMock()
+    nvml.NVMLError = _FakeNVMLError
+    nvml.nvmlDeviceGetCount.return_value = len(gpus)
+    nvml.nvmlDeviceGetHandleByIndex.side_effect = lambda i: gpus[i]
+    nvml.nvmlDeviceGetName.side_effect = lambda h: h[0]
+    nvml.nvmlDeviceGetUtilizationRates.side_effect = lambda h: mock.Mock(gpu=h[1])
+    nvml.nvmlDeviceGetMemoryInfo.side_effect = lambda h: mock.Mock(used=h[2] << 20, total=h[3] << 20)
+    nvml.nvmlDeviceGetTemperature.side_effect = lambda h, sensor: h[4]
+    # Sampling unsupported unless a test opts in via _fake_samples
+    nvml.nvmlDeviceGetSamples.side_effect = _FakeNVMLError("not supported")
+    return nvml
+
+
+def _fake_samples(*pairs):
+    """Build an nvmlDeviceGetSamples result from (timestamp, util) pairs."""
+    return 1, [mock.Mock(timeStamp=ts, sampleValue=mock.Mock(uiVal=val)) for ts, val in pairs]
+
+
+class TestGpuPanelNvml:
+    """gpu_panel_async should prefer in-process NVML calls over forking nvidia-smi."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_nvml(self, monkeypatch):
+        monkeypatch.setitem(sysglance._nvml, "ready", None)
+        monkeypatch.setattr(sysglance.atexit, "register", mock.Mock())
+
+    def test_reads_devices_without_forking(self, monkeypatch):
+        nvml = _fake_pynvml([(b"NVIDIA RTX 4090", 45, 2048, 24576, 55)])
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        with mock.patch("sysglance.asyncio.create_subprocess_exec") as spawn:
+            panel = _collect(sysglance.gpu_panel_async)
+        spawn.assert_not_called()
         rendered = panel.renderable.plain
         assert "GPU 0" in rendered
-        assert "RTX 4090" in rendered
-        assert "55°C" in rendered
+        assert "NVIDIA RTX 4090  |  2048/24576 MiB  |  55°C" in rendered
+
+    def test_initialised_once(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 10, 1, 2, 30)])
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        monkeypatch.setitem(sysglance._gpu_cache, "interval", 0.0)
+        _collect(sysglance.gpu_panel_async)
+        _collect(sysglance.gpu_panel_async)
+        nvml.nvmlInit.assert_called_once()
+        sysglance.atexit.register.assert_called_once_with(nvml.nvmlShutdown)
+        assert nvml.nvmlDeviceGetUtilizationRates.call_count == 2
+
+    def test_averages_buffered_samples(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 99, 1, 2, 30)])
+        nvml.nvmlDeviceGetSamples.side_effect = None
+        nvml.nvmlDeviceGetSamples.return_value = _fake_samples((100, 20), (200, 40), (300, 90))
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        panel = _collect(sysglance.gpu_panel_async)
+        assert " 50.0%" in panel.renderable.plain
+        nvml.nvmlDeviceGetUtilizationRates.assert_not_called()
+
+    def test_sample_cursor_advances(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 99, 1, 2, 30)])
+        nvml.nvmlDeviceGetSamples.side_effect = [
+            _fake_samples((100, 10), (250, 30)),
+            _fake_samples((400, 60)),
+        ]
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        monkeypatch.setitem(sysglance._gpu_cache, "interval", 0.0)
+        _collect(sysglance.gpu_panel_async)
+        panel = _collect(sysglance.gpu_panel_async)
+        cursors = [c.args[2] for c in nvml.nvmlDeviceGetSamples.call_args_list]
+        assert cursors == [0, 250]
+        assert " 60.0%" in panel.renderable.plain
+
+    def test_no_new_samples_uses_instant_reading(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 45, 1, 2, 30)])
+        nvml.nvmlDeviceGetSamples.side_effect = None
+        nvml.nvmlDeviceGetSamples.return_value = (1, [])
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        panel = _collect(sysglance.gpu_panel_async)
+        assert " 45.0%" in panel.renderable.plain
+        assert sysglance._nvml["seen"] == [0]
+
+    def test_slow_init_does_not_block_event_loop(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 10, 1, 2, 30)])
+        release = threading.Event()
+        nvml.nvmlInit.side_effect = lambda: release.wait(5)
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        layout = sysglance.build_layout()
 
-    def test_nvidia_smi_malformed_csv_skipped(self):
-        """Rows with fewer than 6 CSV fields are silently skipped."""
-        csv_line = "0, NVIDIA RTX 4090, 45"  # only 3 fields
-        fake_result = subprocess.CompletedProcess(
-            args=["nvidia-smi"], returncode=0, stdout=csv_line, stderr=""
-        )
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"):
-            with mock.patch("sysglance.subprocess.run", return_value=fake_result):
-                panel = sysglance.gpu_panel()
-        rendered = panel.renderable.plain
-        assert "No GPU data returned" in rendered
+        async def _tick():
+            start = time.monotonic()
+            with _no_tools():
+                await sysglance.refresh_panels_async(layout, budget=0.05)
+            elapsed = time.monotonic() - start
+            assert "gpu" in sysglance._inflight
+            release.set()
+            await asyncio.sleep(0.1)
+            return elapsed
+
+        assert asyncio.run(_tick()) < 1.0
+        assert layout["mem"].renderable.title == "[bold magenta]Memory[/]"
+        assert "A100" in layout["gpu"].renderable.renderable.plain
+
+    def test_nvml_runs_on_daemon_thread(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 10, 1, 2, 30)])
+        threads = []
+        nvml.nvmlInit.side_effect = lambda: threads.append(threading.current_thread())
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        asyncio.run(sysglance.gpu_panel_async())
+        assert [t.name for t in threads] == ["sysglance-nvml"]
+        assert threads[0].daemon
+
+    def test_falls_back_to_nvidia_smi_without_pynvml(self, monkeypatch):
+        monkeypatch.setattr(sysglance, "pynvml", None)
+        with mock.patch("sysglance._nvidia_smi_path", return_value=None):
+            panel = _collect(sysglance.gpu_panel_async)
+        assert "nvidia-smi not found" in panel.renderable.plain
+        assert sysglance._nvml["ready"] is False
+
+    def test_falls_back_when_driver_missing(self, monkeypatch):
+        nvml = _fake_pynvml([])
+        nvml.nvmlInit.side_effect = _FakeNVMLError("libnvidia-ml.so not found")
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        with mock.patch("sysglance._nvidia_smi_path", return_value=None):
+            panel = _collect(sysglance.gpu_panel_async)
+        assert "nvidia-smi not found" in panel.renderable.plain
+
+    def test_shutdown_registered_when_enumeration_fails(self, monkeypatch):
+        nvml = _fake_pynvml([])
+        nvml.nvmlDeviceGetCount.side_effect = _FakeNVMLError("GPU is lost")
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        assert sysglance._nvml_ready() is False
+        sysglance.atexit.register.assert_called_once_with(nvml.nvmlShutdown)
+
+    def test_shutdown_not_registered_when_init_fails(self, monkeypatch):
+        nvml = _fake_pynvml([])
+        nvml.nvmlInit.side_effect = _FakeNVMLError("libnvidia-ml.so not found")
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        assert sysglance._nvml_ready() is False
+        sysglance.atexit.register.assert_not_called()
+
+    def test_query_failure_shows_error(self, monkeypatch):
+        nvml = _fake_pynvml([("A100", 10, 1, 2, 30)])
+        nvml.nvmlDeviceGetTemperature.side_effect = _FakeNVMLError("GPU is lost")
+        monkeypatch.setattr(sysglance, "pynvml", nvml)
+        assert "NVML query failed" in _collect(sysglance.gpu_panel_async).renderable.plain
 
 
 # ---------------------------------------------------------------------------
@@ -188,40 +417,87 @@ _snetio = namedtuple("snetio", [
     "errin", "errout", "dropin", "dropout",
 ])
 
+# Three cores: idle, busy, hot. A tuple so no test can mutate the shared sample.
+_PERCPU = (5.0, 50.0, 90.0)
 
-def _fake_process(pid, name, cpu_pct, mem_pct):
-    """Return a mock that behaves like a psutil.Process from process_iter."""
-    p = mock.MagicMock()
-    p.info = {
-        "pid": pid,
-        "name": name,
-        "cpu_percent": cpu_pct,
-        "memory_percent": mem_pct,
-    }
-    return p
 
+def _fake_cpu(interval=None, percpu=False):
+    """Stand-in for psutil.cpu_percent reporting _PERCPU."""
+    return list(_PERCPU) if percpu else 48.3
 
-# ---------------------------------------------------------------------------
-# parse_args — defaults and --once flag
-# ---------------------------------------------------------------------------
 
-class TestParseArgsDefaults:
-    """Verify parse_args returns correct defaults for all known args."""
+# Shared samples; namedtuples are immutable, so every test can reuse them.
+_VM_16G = _svmem(total=16 * (1 << 30), available=8 * (1 << 30),
+                 percent=50.0, used=8 * (1 << 30), free=8 * (1 << 30))
+_VM_8G = _svmem(total=8 * (1 << 30), available=4 * (1 << 30),
+                percent=50.0, used=4 * (1 << 30), free=4 * (1 << 30))
+_SWAP_4G = _sswap(total=4 * (1 << 30), used=1 * (1 << 30),
+                  free=3 * (1 << 30), percent=25.0, sin=0, sout=0)
+_SWAP_NONE = _sswap(total=0, used=0, free=0, percent=0.0, sin=0, sout=0)
+_ROOT_PART = _sdiskpart("/dev/sda1", "/", "ext4", "rw")
+_USAGE_500G = _sdiskusage(total=500 * (1 << 30), used=200 * (1 << 30),
+                          free=300 * (1 << 30), percent=40.0)
 
-    def test_defaults_no_args(self):
-        with mock.patch("sys.argv", ["sysglance"]):
-            args = sysglance.parse_args()
-        assert args.once is False
 
-    def test_once_sets_true(self):
-        with mock.patch("sys.argv", ["sysglance", "--once"]):
-            args = sysglance.parse_args()
-        assert args.once is True
+class _FakeProcess:
+    """Just enough of psutil.Process for _sample_procs, without MagicMock's weight.
 
-    def test_namespace_has_once_attr(self):
-        with mock.patch("sys.argv", ["sysglance"]):
-            args = sysglance.parse_args()
-        assert hasattr(args, "once")
+    *errors* maps a method name to the exception it should raise; reads are
+    asserted to happen inside oneshot(), as the real cache relies on.
+    """
+
+    __slots__ = ("pid", "_name", "_cpu", "_mem", "cpu_calls", "oneshots", "errors", "_in_oneshot")
+
+    def __init__(self, pid, name, cpu_pct, mem_pct):
+        self.pid = pid
+        self._name = name
+        self._cpu = cpu_pct
+        self._mem = mem_pct
+        self.cpu_calls = 0
+        self.oneshots = 0
+        self.errors = {}
+        self._in_oneshot = False
+
+    @contextlib.contextmanager
+    def oneshot(self):
+        self.oneshots += 1
+        self._in_oneshot = True
+        try:
+            yield
+        finally:
+            self._in_oneshot = False
+
+    def _read(self, method, value):
+        assert self._in_oneshot, f"{method}() called outside oneshot()"
+        if method in self.errors:
+            raise self.errors[method]
+        return value
+
+    def cpu_percent(self):
+        self.cpu_calls += 1
+        return self._read("cpu_percent", self._cpu)
+
+    def name(self):
+        return self._read("name", self._name)
+
+    def memory_percent(self):
+        return self._read("memory_percent", self._mem)
+
+
+def _patch_procs(fake_procs):
+    """Patch psutil.pids/psutil.Process to expose *fake_procs*."""
+    by_pid = {p.pid: p for p in fake_procs}
+
+    def _process(pid):
+        if pid not in by_pid:
+            raise sysglance.psutil.NoSuchProcess(pid)
+        return by_pid[pid]
+
+    return mock.patch.multiple(
+        "sysglance.psutil",
+        pids=mock.MagicMock(return_value=list(by_pid)),
+        Process=mock.MagicMock(side_effect=_process),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -231,43 +507,90 @@ class TestParseArgsDefaults:
 class TestCpuPanelReturnsPanel:
     """cpu_panel should return a Panel with per-core info."""
 
+    # psutil.cpu_percent is already _fake_cpu via the autouse fixture
+
     def test_returns_panel(self):
-        with mock.patch("sysglance.psutil.cpu_percent") as mock_cpu:
-            mock_cpu.side_effect = lambda percpu=False: [10.0, 20.0] if percpu else 15.0
-            result = sysglance.cpu_panel()
-        assert isinstance(result, Panel)
+        assert isinstance(sysglance.cpu_panel(), Panel)
 
     def test_contains_core_labels(self):
-        with mock.patch("sysglance.psutil.cpu_percent") as mock_cpu:
-            mock_cpu.side_effect = lambda percpu=False: [5.0, 50.0, 90.0] if percpu else 48.3
-            result = sysglance.cpu_panel()
-        rendered = result.renderable.plain
+        rendered = sysglance.cpu_panel().renderable.plain
         assert "Core 0" in rendered
         assert "Core 1" in rendered
         assert "Core 2" in rendered
+        assert "Core 3" not in rendered
         assert "Average" in rendered
+        assert "48.3%" in rendered
+
+
+_PROC_STAT_T0 = b"""cpu  200 0 100 700 0 0 0 0 0 0
+cpu0 100 0 50 350 0 0 0 0 0 0
+cpu1 100 0 50 350 0 0 0 0 0 0
+intr 78683 0 0
+ctxt 1234
+"""
+
+# One second later: cpu0 was fully busy, cpu1 idle; the guest columns of
+# cpu1 grew too but must not count twice.
+_PROC_STAT_T1 = b"""cpu  300 0 100 800 0 0 0 0 0 0
+cpu0 200 0 50 350 0 0 0 0 0 0
+cpu1 100 0 50 450 0 0 0 0 40 0
+intr 78699 0 0
+ctxt 1240
+"""
+
+
+class TestProcStatCpu:
+    """cpu_panel should compute per-core usage from /proc/stat deltas."""
+
+    @pytest.fixture
+    def proc_stat(self, monkeypatch, tmp_path):
+        path = tmp_path / "stat"
+        monkeypatch.setattr(sysglance, "_PROC_STAT", str(path))
+        monkeypatch.setattr(sysglance, "_HAVE_PROC_STAT", True)
+        return path
+
+    def test_first_read_is_since_boot(self, proc_stat):
+        proc_stat.write_bytes(_PROC_STAT_T0)
+        percents, avg = sysglance._cpu_percents()
+        assert percents == [30.0, 30.0]
+        assert avg == 30.0
+
+    def test_delta_between_reads(self, proc_stat):
+        proc_stat.write_bytes(_PROC_STAT_T0)
+        sysglance._cpu_percents()
+        proc_stat.write_bytes(_PROC_STAT_T1)
+        percents, avg = sysglance._cpu_percents()
+        assert percents == [100.0, 0.0]
+        assert avg == 50.0
+
+    def test_no_elapsed_time_reads_zero(self, proc_stat):
+        proc_stat.write_bytes(_PROC_STAT_T0)
+        sysglance._cpu_percents()
+        percents, avg = sysglance._cpu_percents()
+        assert percents == [0.0, 0.0]
+        assert avg == 0.0
+
+    def test_psutil_not_used(self, proc_stat):
+        proc_stat.write_bytes(_PROC_STAT_T0)
+        with mock.patch("sysglance.psutil.cpu_percent") as cpu_percent:
+            panel = sysglance.cpu_panel()
+        cpu_percent.assert_not_called()
+        assert "Core 1" in panel.renderable.plain
+        assert "Core 2" not in panel.renderable.plain
 
 
 class TestMemPanelReturnsPanel:
     """mem_panel should return a Panel with RAM and swap info."""
 
     def test_returns_panel(self):
-        fake_vm = _svmem(total=16 * (1 << 30), available=8 * (1 << 30),
-                         percent=50.0, used=8 * (1 << 30), free=8 * (1 << 30))
-        fake_sw = _sswap(total=4 * (1 << 30), used=1 * (1 << 30),
-                         free=3 * (1 << 30), percent=25.0, sin=0, sout=0)
-        with mock.patch("sysglance.psutil.virtual_memory", return_value=fake_vm), \
-             mock.patch("sysglance.psutil.swap_memory", return_value=fake_sw):
+        with mock.patch("sysglance.psutil.virtual_memory", return_value=_VM_16G), \
+             mock.patch("sysglance.psutil.swap_memory", return_value=_SWAP_4G):
             result = sysglance.mem_panel()
         assert isinstance(result, Panel)
 
     def test_contains_ram_and_swap_labels(self):
-        fake_vm = _svmem(total=16 * (1 << 30), available=8 * (1 << 30),
-                         percent=50.0, used=8 * (1 << 30), free=8 * (1 << 30))
-        fake_sw = _sswap(total=4 * (1 << 30), used=1 * (1 << 30),
-                         free=3 * (1 << 30), percent=25.0, sin=0, sout=0)
-        with mock.patch("sysglance.psutil.virtual_memory", return_value=fake_vm), \
-             mock.patch("sysglance.psutil.swap_memory", return_value=fake_sw):
+        with mock.patch("sysglance.psutil.virtual_memory", return_value=_VM_16G), \
+             mock.patch("sysglance.psutil.swap_memory", return_value=_SWAP_4G):
             result = sysglance.mem_panel()
         rendered = result.renderable.plain
         assert "RAM" in rendered
@@ -275,11 +598,8 @@ class TestMemPanelReturnsPanel:
         assert "GiB" in rendered
 
     def test_zero_swap(self):
-        fake_vm = _svmem(total=8 * (1 << 30), available=4 * (1 << 30),
-                         percent=50.0, used=4 * (1 << 30), free=4 * (1 << 30))
-        fake_sw = _sswap(total=0, used=0, free=0, percent=0.0, sin=0, sout=0)
-        with mock.patch("sysglance.psutil.virtual_memory", return_value=fake_vm), \
-             mock.patch("sysglance.psutil.swap_memory", return_value=fake_sw):
+        with mock.patch("sysglance.psutil.virtual_memory", return_value=_VM_8G), \
+             mock.patch("sysglance.psutil.swap_memory", return_value=_SWAP_NONE):
             result = sysglance.mem_panel()
         assert isinstance(result, Panel)
 
@@ -288,11 +608,8 @@ class TestDiskPanelReturnsPanel:
     """disk_panel should return a Panel with a table of disk partitions."""
 
     def test_returns_panel(self):
-        fake_parts = [_sdiskpart("/dev/sda1", "/", "ext4", "rw")]
-        fake_usage = _sdiskusage(total=500 * (1 << 30), used=200 * (1 << 30),
-                                 free=300 * (1 << 30), percent=40.0)
-        with mock.patch("sysglance.psutil.disk_partitions", return_value=fake_parts), \
-             mock.patch("sysglance.psutil.disk_usage", return_value=fake_usage):
+        with mock.patch("sysglance.psutil.disk_partitions", return_value=[_ROOT_PART]), \
+             mock.patch("sysglance.psutil.disk_usage", return_value=_USAGE_500G):
             result = sysglance.disk_panel()
         assert isinstance(result, Panel)
 
@@ -302,17 +619,12 @@ class TestDiskPanelReturnsPanel:
         assert isinstance(result, Panel)
 
     def test_permission_error_skipped(self):
-        fake_parts = [
-            _sdiskpart("/dev/sda1", "/", "ext4", "rw"),
-            _sdiskpart("/dev/sdb1", "/mnt/secret", "ext4", "rw"),
-        ]
-        fake_usage = _sdiskusage(total=500 * (1 << 30), used=200 * (1 << 30),
-                                 free=300 * (1 << 30), percent=40.0)
+        fake_parts = [_ROOT_PART, _sdiskpart("/dev/sdb1", "/mnt/secret", "ext4", "rw")]
 
         def _usage_side_effect(mp):
             if mp == "/mnt/secret":
                 raise PermissionError("no access")
-            return fake_usage
+            return _USAGE_500G
 
         with mock.patch("sysglance.psutil.disk_partitions", return_value=fake_parts), \
              mock.patch("sysglance.psutil.disk_usage", side_effect=_usage_side_effect):
@@ -320,24 +632,156 @@ class TestDiskPanelReturnsPanel:
         assert isinstance(result, Panel)
 
 
+class TestDiskUsages:
+    """Mounts are queried concurrently and slow ones are left out."""
+
+    def test_preserves_mount_order(self):
+        def _usage(mp):
+            time.sleep(0.02 if mp == "/" else 0)
+            return _sdiskusage(total=1, used=0, free=1, percent=0.0)
+
+        with mock.patch("sysglance.psutil.disk_usage", side_effect=_usage):
+            usages = sysglance._disk_usages(["/", "/home", "/var"])
+        assert [mp for mp, _ in usages] == ["/", "/home", "/var"]
+
+    def test_hung_mount_skipped_and_not_resubmitted(self):
+        release = threading.Event()
+        calls = []
+
+        def _usage(mp):
+            calls.append(mp)
+            if mp == "/mnt/nfs":
+                release.wait(5)
+            return _sdiskusage(total=1, used=0, free=1, percent=0.0)
+
+        try:
+            with mock.patch("sysglance.psutil.disk_usage", side_effect=_usage):
+                first = sysglance._disk_usages(["/", "/mnt/nfs"], timeout=0.05)
+                second = sysglance._disk_usages(["/", "/mnt/nfs"], timeout=0.05)
+        finally:
+            release.set()
+        assert [mp for mp, _ in first] == ["/"]
+        assert [mp for mp, _ in second] == ["/"]
+        assert calls.count("/mnt/nfs") == 1
+
+    def test_hung_mount_does_not_block_exit(self):
+        release = threading.Event()
+        try:
+            with mock.patch("sysglance.psutil.disk_usage", side_effect=lambda mp: release.wait(5)):
+                sysglance._disk_usages(["/mnt/nfs"], timeout=0.01)
+            workers = [t for t in threading.enumerate() if t.name == "sysglance-disk"]
+            assert workers and all(t.daemon for t in workers)
+        finally:
+            release.set()
+
+
 class TestProcPanelReturnsPanel:
     """proc_panel should return a Panel with top processes."""
 
     def test_returns_panel(self):
         fake_procs = [
-            _fake_process(1, "python", 45.0, 2.1),
-            _fake_process(2, "chrome", 30.0, 8.5),
-            _fake_process(3, "bash", 1.0, 0.3),
+            _FakeProcess(1, "python", 45.0, 2.1),
+            _FakeProcess(2, "chrome", 30.0, 8.5),
+            _FakeProcess(3, "bash", 1.0, 0.3),
         ]
-        with mock.patch("sysglance.psutil.process_iter", return_value=fake_procs):
+        with _patch_procs(fake_procs):
             result = sysglance.proc_panel()
         assert isinstance(result, Panel)
 
     def test_returns_panel_empty_process_list(self):
-        with mock.patch("sysglance.psutil.process_iter", return_value=[]):
+        with _patch_procs([]):
             result = sysglance.proc_panel()
         assert isinstance(result, Panel)
 
+    def test_sorted_by_cpu(self):
+        fake_procs = [
+            _FakeProcess(1, "bash", 1.0, 0.3),
+            _FakeProcess(2, "python", 45.0, 2.1),
+        ]
+        with _patch_procs(fake_procs):
+            sysglance.proc_panel()
+            result = sysglance.proc_panel()
+        assert list(result.renderable.columns[1].cells) == ["python", "bash"]
+
+
+class TestProcCache:
+    """The process cache should follow the PID list across ticks."""
+
+    def test_process_objects_reused(self):
+        fake_procs = [_FakeProcess(1, "python", 45.0, 2.1)]
+        with _patch_procs(fake_procs):
+            sysglance.proc_panel()
+            sysglance.proc_panel()
+            assert sysglance.psutil.Process.call_count == 1
+        assert fake_procs[0].cpu_calls == 2
+
+    def test_sampled_inside_oneshot(self):
+        proc = _FakeProcess(1, "python", 45.0, 2.1)
+        with _patch_procs([proc]):
+            sysglance._sample_procs()
+        # Reads outside oneshot() would trip the fake's own assertion
+        assert proc.oneshots == 1
+
+    def test_exited_pids_dropped(self):
+        with _patch_procs([_FakeProcess(1, "a", 1.0, 1.0), _FakeProcess(2, "b", 1.0, 1.0)]):
+            sysglance.proc_panel()
+        assert set(sysglance._proc_cache) == {1, 2}
+        with _patch_procs([_FakeProcess(2, "b", 1.0, 1.0)]):
+            sysglance.proc_panel()
+        assert set(sysglance._proc_cache) == {2}
+
+    def test_new_processes_only_primed(self):
+        proc = _FakeProcess(1, "python", 45.0, 2.1)
+        with _patch_procs([proc]):
+            first = sysglance._sample_procs()
+            second = sysglance._sample_procs()
+        assert first == []
+        assert [p["pid"] for p in second] == [1]
+        assert proc.cpu_calls == 2
+
+    def test_process_vanishing_mid_sample_dropped(self):
+        gone = _FakeProcess(7, "short", 0.0, 0.0)
+        with _patch_procs([gone, _FakeProcess(8, "ok", 3.0, 1.0)]):
+            sysglance._sample_procs()
+            gone.errors["name"] = sysglance.psutil.NoSuchProcess(7)
+            procs = sysglance._sample_procs()
+        assert [p["pid"] for p in procs] == [8]
+        assert 7 not in sysglance._proc_cache
+
+    def test_access_denied_skipped_but_kept(self):
+        locked = _FakeProcess(9, "root-only", 0.0, 0.0)
+        locked.errors["memory_percent"] = sysglance.psutil.AccessDenied(9)
+        with _patch_procs([locked]):
+            sysglance._sample_procs()
+            procs = sysglance._sample_procs()
+        assert procs == []
+        assert 9 in sysglance._proc_cache
+
+
+class TestTableReuse:
+    """Table panels should refill long-lived tables instead of rebuilding them."""
+
+    def _disk_panel(self):
+        with mock.patch("sysglance.psutil.disk_partitions", return_value=[_ROOT_PART]), \
+             mock.patch("sysglance.psutil.disk_usage", return_value=_USAGE_500G):
+            return sysglance.disk_panel()
+
+    def test_same_panel_returned(self):
+        assert self._disk_panel() is self._disk_panel()
+
+    def test_tables_alternate(self):
+        first = self._disk_panel().renderable
+        second = self._disk_panel().renderable
+        third = self._disk_panel().renderable
+        assert first is not second
+        assert first is third
+
+    def test_rows_do_not_accumulate(self):
+        for _ in range(3):
+            table = self._disk_panel().renderable
+        assert table.row_count == 1
+        assert list(table.columns[0].cells) == ["/"]
+
 
 class TestNetPanelReturnsPanel:
     """net_panel should return a Panel with network I/O counters."""
@@ -371,103 +815,615 @@ class TestNetPanelReturnsPanel:
         assert isinstance(result, Panel)
 
 
+def _netio(sent, recv):
+    return _snetio(bytes_sent=sent, bytes_recv=recv, packets_sent=0, packets_recv=0,
+                   errin=0, errout=0, dropin=0, dropout=0)
+
+
+class TestNetRates:
+    """net_panel shows per-second deltas between consecutive samples."""
+
+    def _sample(self, counters, now):
+        with mock.patch("sysglance.time.monotonic", return_value=now):
+            return sysglance._net_rates(counters)
+
+    def test_first_sample_is_zero(self):
+        ifaces, sent, recv = self._sample({"eth0": _netio(10 << 20, 20 << 20)}, 100.0)
+        assert ifaces == ["eth0"]
+        assert sent.tolist() == [0.0]
+        assert recv.tolist() == [0.0]
+
+    def test_rate_is_delta_over_elapsed(self):
+        self._sample({"eth0": _netio(0, 0), "wlan0": _netio(0, 0)}, 100.0)
+        ifaces, sent, recv = self._sample(
+            {"wlan0": _netio(1 << 20, 0), "eth0": _netio(4 << 20, 8 << 20)}, 102.0,
+        )
+        assert ifaces == ["eth0", "wlan0"]
+        assert sent.tolist() == [2.0, 0.5]
+        assert recv.tolist() == [4.0, 0.0]
+
+    def test_counter_reset_is_not_negative(self):
+        self._sample({"eth0": _netio(8 << 20, 8 << 20)}, 100.0)
+        _, sent, recv = self._sample({"eth0": _netio(0, 0)}, 101.0)
+        assert sent.tolist() == [0.0]
+        assert recv.tolist() == [0.0]
+
+    def test_interface_change_resets(self):
+        self._sample({"eth0": _netio(0, 0)}, 100.0)
+        ifaces, sent, _ = self._sample({"eth0": _netio(4 << 20, 0), "veth1": _netio(1, 1)}, 101.0)
+        assert ifaces == ["eth0", "veth1"]
+        assert sent.tolist() == [0.0, 0.0]
+
+    def test_panel_renders_rates(self):
+        with mock.patch("sysglance.time.monotonic", return_value=100.0), \
+             mock.patch("sysglance.psutil.net_io_counters",
+                        return_value={"eth0": _netio(1, 1)}):
+            sysglance.net_panel()
+        with mock.patch("sysglance.time.monotonic", return_value=101.0), \
+             mock.patch("sysglance.psutil.net_io_counters",
+                        return_value={"eth0": _netio(1 + (3 << 20), 1)}):
+            table = sysglance.net_panel().renderable
+        assert list(table.columns[1].cells) == ["3.00 MiB/s"]
+        assert list(table.columns[2].cells) == ["0.00 MiB/s"]
+
+
 class TestHeaderPanelReturnsPanel:
     """header_panel should return a Panel with clock and uptime."""
 
+    _NOW = 1_700_000_000.0
+
+    @pytest.fixture(autouse=True)
+    def _fixed_clock(self, monkeypatch):
+        monkeypatch.setattr(sysglance.time, "time", lambda: self._NOW)
+
     def test_returns_panel(self):
-        boot_ts = time.time() - 86400
-        with mock.patch("sysglance.psutil.boot_time", return_value=boot_ts):
+        with mock.patch("sysglance._BOOT_TIME", self._NOW - 86400):
             result = sysglance.header_panel()
         assert isinstance(result, Panel)
 
     def test_contains_uptime_info(self):
-        boot_ts = time.time() - (2 * 86400 + 3 * 3600 + 15 * 60)
-        with mock.patch("sysglance.psutil.boot_time", return_value=boot_ts):
+        boot_ts = self._NOW - (2 * 86400 + 3 * 3600 + 15 * 60)
+        with mock.patch("sysglance._BOOT_TIME", boot_ts):
             result = sysglance.header_panel()
         rendered = result.renderable.plain
         assert "sysglance" in rendered
-        assert "2d" in rendered
+        assert "up 2d 3h 15m" in rendered
 
+    def test_boot_time_not_reread(self):
+        with mock.patch("sysglance.psutil.boot_time") as boot_time:
+            sysglance.header_panel()
+        boot_time.assert_not_called()
 
-class TestGpuPanelReturnsPanel:
-    """gpu_panel should always return a Panel regardless of nvidia-smi availability."""
 
-    def test_returns_panel_when_no_gpu(self):
-        with mock.patch("sysglance.shutil.which", return_value=None):
-            result = sysglance.gpu_panel()
-        assert isinstance(result, Panel)
+# ---------------------------------------------------------------------------
+# Docker / GPU panel caching
+# ---------------------------------------------------------------------------
+
+class TestToolPanelCache:
+    """The docker and GPU panels should only re-poll once their interval elapses."""
+
+    def test_gpu_reuses_panel_within_interval(self):
+        spawn = _fake_exec(**_SMI_OK)
+        with mock.patch("sysglance._nvidia_smi_path", return_value=_SMI_PATH), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            first = _collect(sysglance.gpu_panel_async)
+            second = _collect(sysglance.gpu_panel_async)
+        assert first is second
+        assert spawn.call_count == 1
+
+    def test_gpu_repolls_after_interval(self, monkeypatch):
+        monkeypatch.setitem(sysglance._gpu_cache, "interval", 0.0)
+        spawn = _fake_exec(**_SMI_OK)
+        with mock.patch("sysglance._nvidia_smi_path", return_value=_SMI_PATH), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            _collect(sysglance.gpu_panel_async)
+            _collect(sysglance.gpu_panel_async)
+        assert spawn.call_count == 2
+
+    def test_docker_reuses_panel_within_interval(self):
+        spawn = _fake_exec()
+        with mock.patch("sysglance._docker_path", return_value="/usr/bin/docker"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            first = _collect(sysglance.docker_panel_async)
+            second = _collect(sysglance.docker_panel_async)
+        assert first is second
+        assert spawn.call_count == 1
+
+    def test_tool_paths_probed_once(self, monkeypatch):
+        monkeypatch.setitem(sysglance._gpu_cache, "interval", 0.0)
+        monkeypatch.setitem(sysglance._docker_cache, "interval", 0.0)
+        with mock.patch("sysglance.shutil.which", return_value=None) as which:
+            for _ in range(3):
+                _collect(sysglance.gpu_panel_async)
+                _collect(sysglance.docker_panel_async)
+        assert sorted(c.args[0] for c in which.call_args_list) == ["docker", "nvidia-smi"]
+
+    def test_interval_flags(self):
+        with mock.patch("sys.argv", ["sysglance", "--docker-interval", "30",
+                                     "--gpu-interval", "2.5"]):
+            args = sysglance.parse_args()
+        assert args.docker_interval == 30.0
+        assert args.gpu_interval == 2.5
+
+    @pytest.mark.parametrize("flag", ["--docker-interval", "--gpu-interval"])
+    @pytest.mark.parametrize("value", ["0", "-5", "nan", "inf", "soon"])
+    def test_interval_must_be_positive(self, flag, value, capsys):
+        with mock.patch("sys.argv", ["sysglance", flag, value]):
+            with pytest.raises(SystemExit) as exc:
+                sysglance.parse_args()
+        assert exc.value.code == 2
+        assert flag in capsys.readouterr().err
+
+    def test_interval_defaults(self):
+        with mock.patch("sys.argv", ["sysglance"]):
+            args = sysglance.parse_args()
+        assert args.docker_interval == 10.0
+        assert args.gpu_interval == 5.0
+
+
+# ---------------------------------------------------------------------------
+# docker ps JSON parsing (orjson when installed, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+_PS_LINES = "\n".join([
+    json.dumps({"Names": "web", "Image": "nginx", "Status": "Up 2 hours", "Ports": "80/tcp"}),
+    "{not json",
+    json.dumps({"Names": "db", "Image": "postgres", "Status": "Restarting (1)", "Ports": ""}),
+])
 
-    def test_returns_panel_when_gpu_present(self):
-        csv_line = "0, NVIDIA RTX 3080, 30, 1024, 10240, 60"
-        fake_result = subprocess.CompletedProcess(
-            args=["nvidia-smi"], returncode=0, stdout=csv_line, stderr=""
-        )
-        with mock.patch("sysglance.shutil.which", return_value="/usr/bin/nvidia-smi"), \
-             mock.patch("sysglance.subprocess.run", return_value=fake_result):
-            result = sysglance.gpu_panel()
-        assert isinstance(result, Panel)
+
+@pytest.mark.parametrize("loads", [sysglance._json_loads, json.loads])
+def test_docker_ps_parsing(loads, monkeypatch):
+    monkeypatch.setattr(sysglance, "_json_loads", loads)
+    table = sysglance._docker_result(0, _PS_LINES, "").renderable
+    assert list(table.columns[0].cells) == ["web", "db"]
+    assert list(table.columns[2].cells) == ["[green]Up 2 hours[/]", "[yellow]Restarting (1)[/]"]
+
+
+# ---------------------------------------------------------------------------
+# Docker engine socket mirror
+# ---------------------------------------------------------------------------
+
+_API_CONTAINERS = [
+    {
+        "Id": "abc123",
+        "Names": ["/web"],
+        "Image": "nginx:latest",
+        "State": "running",
+        "Status": "Up 2 hours",
+        "Ports": [
+            {"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+            {"PrivatePort": 443, "Type": "tcp"},
+        ],
+    },
+]
+
+
+class _FakeEngine(http.server.BaseHTTPRequestHandler):
+    """Serves /containers/json and a chunked /events stream like dockerd."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        if self.path.startswith("/containers/json"):
+            body = json.dumps(_API_CONTAINERS).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path.startswith("/events"):
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for event in self.server.events:
+                chunk = json.dumps(event).encode() + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_error(404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def docker_engine(monkeypatch):
+    """Run a fake Docker engine on a Unix socket and point sysglance at it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "docker.sock")
+        server = socketserver.ThreadingUnixStreamServer(path, _FakeEngine)
+        server.daemon_threads = True
+        server.paths = []
+        server.events = []
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        monkeypatch.setattr(sysglance, "_DOCKER_SOCKET", path)
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestDockerSocket:
+    """docker_panel should mirror containers from the engine socket."""
+
+    def test_list_is_shaped_like_docker_ps(self, docker_engine):
+        assert sysglance._docker_list() == [{
+            "Names": "web",
+            "Image": "nginx:latest",
+            "Status": "Up 2 hours",
+            "Ports": "0.0.0.0:8080->80/tcp, 443/tcp",
+        }]
+
+    def test_window_reloads_on_each_event(self, docker_engine):
+        docker_engine.events = [
+            {"Type": "container", "Action": "start", "id": "abc123"},
+            {"Type": "container", "Action": "die", "id": "def456"},
+        ]
+        sysglance._docker_watch_window(100, 110)
+        lists = [p for p in docker_engine.paths if p.startswith("/containers/json")]
+        events = [p for p in docker_engine.paths if p.startswith("/events")]
+        assert len(lists) == 3
+        assert "since=100" in events[0] and "until=110" in events[0]
+        assert sysglance._docker_state["live"] is True
+        assert sysglance._docker_state["containers"][0]["Names"] == "web"
+
+    def test_watch_marks_mirror_stale_when_socket_fails(self):
+        sysglance._docker_state.update(live=True, thread=object())
+        sysglance._docker_watch()
+        assert sysglance._docker_state["live"] is False
+        assert sysglance._docker_state["thread"] is None
+
+    def test_watcher_restarts_after_backoff(self, docker_engine):
+        state = sysglance._docker_state
+        with mock.patch("sysglance._docker_list", side_effect=OSError("dockerd restarting")):
+            sysglance._docker_watch()
+            assert state["backoff"] == 2.0
+            sysglance._docker_watch()
+        assert state["backoff"] == 4.0
+        with mock.patch("sysglance.threading.Thread") as thread:
+            sysglance._docker_watch_start()
+            thread.assert_not_called()
+            state["retry_at"] = 0.0
+            sysglance._docker_watch_start()
+        thread.return_value.start.assert_called_once()
+
+    def test_successful_list_resets_backoff(self, docker_engine):
+        sysglance._docker_state["backoff"] = 16.0
+        sysglance._docker_watch_window(100, 110)
+        assert sysglance._docker_state["backoff"] == 1.0
+
+    def test_panel_does_not_start_watcher(self, docker_engine):
+        with mock.patch("sysglance._docker_path", return_value=None):
+            _collect(sysglance.docker_panel_async)
+        assert sysglance._docker_state["thread"] is None
+
+    def test_live_mirror_skips_docker_ps(self):
+        sysglance._docker_state.update(live=True, containers=[
+            {"Names": "db", "Image": "postgres:16", "Status": "Up 3 days", "Ports": ""},
+        ])
+        with mock.patch("sysglance.asyncio.create_subprocess_exec") as spawn:
+            panel = _collect(sysglance.docker_panel_async)
+        spawn.assert_not_called()
+        assert list(panel.renderable.columns[0].cells) == ["db"]
+
+    def test_live_mirror_empty(self):
+        sysglance._docker_state["live"] = True
+        assert "No running containers" in _collect(sysglance.docker_panel_async).renderable.plain
+
+    def test_watcher_not_started_without_socket(self):
+        sysglance._docker_watch_start()
+        assert sysglance._docker_state["thread"] is None
+
+    def test_watcher_not_started_with_docker_host(self, docker_engine, monkeypatch):
+        monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.5:2376")
+        sysglance._docker_watch_start()
+        assert sysglance._docker_state["thread"] is None
+
+    def test_watcher_not_started_with_docker_context(self, docker_engine, monkeypatch):
+        monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+        sysglance._docker_watch_start()
+        assert sysglance._docker_state["thread"] is None
+
+    @pytest.mark.parametrize("current,mirrored", [("remote", False), ("default", True)])
+    def test_current_context_from_config(self, docker_engine, monkeypatch, tmp_path, current, mirrored):
+        (tmp_path / "config.json").write_text(json.dumps({"currentContext": current}))
+        monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+        assert sysglance._docker_uses_local_socket() is mirrored
+
+    def test_default_context_env_uses_socket(self, monkeypatch):
+        monkeypatch.setenv("DOCKER_CONTEXT", "default")
+        assert sysglance._docker_uses_local_socket() is True
+
+    def test_watcher_started_once(self, docker_engine):
+        with mock.patch("sysglance.threading.Thread") as thread:
+            sysglance._docker_watch_start()
+            sysglance._docker_watch_start()
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Async collectors (docker_panel_async, gpu_panel_async, refresh_panels_async)
+# ---------------------------------------------------------------------------
+
+class TestAsyncPanels:
+    """The async collectors should render docker and nvidia-smi output without blocking."""
+
+    def test_gpu_async_success(self):
+        fake = _fake_exec(stdout="0, NVIDIA RTX 4090, 45, 2048, 24576, 55")
+        with mock.patch("sysglance._nvidia_smi_path", return_value="/usr/bin/nvidia-smi"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", fake):
+            panel = asyncio.run(sysglance.gpu_panel_async())
+        rendered = panel.renderable.plain
+        assert "GPU 0" in rendered
+        assert "55°C" in rendered
+        assert fake.call_args.args[0] == "/usr/bin/nvidia-smi"
+
+    def test_gpu_async_no_binary(self):
+        with mock.patch("sysglance._nvidia_smi_path", return_value=None):
+            panel = asyncio.run(sysglance.gpu_panel_async())
+        assert "nvidia-smi not found" in panel.renderable.plain
+
+    def test_gpu_async_timeout_kills_child(self):
+        spawn = _fake_exec(hang=True)
+        with mock.patch("sysglance._nvidia_smi_path", return_value="/usr/bin/nvidia-smi"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", spawn):
+            panel = asyncio.run(sysglance.gpu_panel_async())
+        assert "No GPU detected" in panel.renderable.plain
+        spawn.return_value.kill.assert_called_once()
+
+    def test_docker_async_error_message(self):
+        fake = _fake_exec(returncode=1, stderr="Cannot connect to the Docker daemon\nmore")
+        with mock.patch("sysglance._docker_path", return_value="/usr/bin/docker"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", fake):
+            panel = asyncio.run(sysglance.docker_panel_async())
+        assert panel.renderable.plain == "Cannot connect to the Docker daemon"
+
+    def test_docker_async_no_containers(self):
+        with mock.patch("sysglance._docker_path", return_value="/usr/bin/docker"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec", _fake_exec()):
+            panel = asyncio.run(sysglance.docker_panel_async())
+        assert "No running containers" in panel.renderable.plain
+
+    def test_refresh_panels_async_fills_every_slot(self):
+        layout = sysglance.build_layout()
+        with _no_tools():
+            asyncio.run(sysglance.refresh_panels_async(layout))
+        for name in ("header", "cpu", "mem", "disk", "proc", "net", "docker", "gpu"):
+            assert isinstance(layout[name].renderable, Panel)
 
 
 # ---------------------------------------------------------------------------
 # build_layout returns a Layout with expected sub-layouts
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def layout():
+    """One Layout shared by the read-only structure checks below."""
+    return sysglance.build_layout()
+
+
 class TestBuildLayout:
     """build_layout should return a properly structured Layout."""
 
-    def test_returns_layout(self):
-        result = sysglance.build_layout()
-        assert isinstance(result, Layout)
+    def test_returns_layout(self, layout):
+        assert isinstance(layout, Layout)
+
+    @pytest.mark.parametrize("name", ["header", "cpu", "mem", "disk", "proc", "net", "gpu", "docker"])
+    def test_has_slot(self, layout, name):
+        assert layout[name] is not None
+
+
+# ---------------------------------------------------------------------------
+# Parallel refresh with a tick budget
+# ---------------------------------------------------------------------------
+
+class TestRefreshBudget:
+    """A slow collector must not hold up the others past the tick budget."""
+
+    @pytest.fixture
+    def slow_cpu(self, monkeypatch):
+        release = threading.Event()
+        slow = Panel("slow")
+
+        def _slow_cpu():
+            release.wait(5)
+            return slow
 
-    def test_has_header_slot(self):
+        monkeypatch.setattr(sysglance, "_PSUTIL_PANELS", (
+            ("cpu", _slow_cpu),
+            ("mem", lambda: Panel("mem")),
+        ))
+        monkeypatch.setattr(sysglance, "_SUBPROCESS_PANELS", ())
+        yield release, slow
+        release.set()
+
+    def test_late_panel_keeps_previous_content(self, slow_cpu):
+        release, slow = slow_cpu
+        layout = sysglance.build_layout()
+        previous = Panel("previous")
+        layout["cpu"].update(previous)
+
+        async def _tick():
+            await sysglance.refresh_panels_async(layout, budget=0.05)
+            assert layout["mem"].renderable.renderable == "mem"
+            assert layout["cpu"].renderable is previous
+            assert "cpu" in sysglance._inflight
+            release.set()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(_tick())
+        assert layout["cpu"].renderable is slow
+        assert "cpu" not in sysglance._inflight
+
+    def test_late_panel_not_resubmitted(self, slow_cpu):
         layout = sysglance.build_layout()
-        assert layout["header"] is not None
 
-    def test_has_cpu_slot(self):
+        async def _two_ticks():
+            await sysglance.refresh_panels_async(layout, budget=0.05)
+            await sysglance.refresh_panels_async(layout, budget=0.05)
+
+        with mock.patch.object(sysglance._panel_pool, "submit",
+                               wraps=sysglance._panel_pool.submit) as submit:
+            asyncio.run(_two_ticks())
+        assert submit.call_count == 3
+
+    def test_no_budget_waits_for_everything(self, slow_cpu):
+        release, slow = slow_cpu
         layout = sysglance.build_layout()
-        assert layout["cpu"] is not None
+        threading.Timer(0.05, release.set).start()
+        sysglance.refresh_panels(layout)
+        assert layout["cpu"].renderable is slow
+        assert not sysglance._inflight
 
-    def test_has_mem_slot(self):
+    def test_fast_panel_updates_before_slow_one_finishes(self, slow_cpu):
+        release, slow = slow_cpu
         layout = sysglance.build_layout()
-        assert layout["mem"] is not None
 
-    def test_has_disk_slot(self):
+        async def _tick():
+            tick = asyncio.ensure_future(
+                sysglance.refresh_panels_async(layout, budget=None))
+            await asyncio.sleep(0.05)
+            assert layout["mem"].renderable.renderable == "mem"
+            assert not tick.done()
+            release.set()
+            await tick
+
+        asyncio.run(_tick())
+        assert layout["cpu"].renderable is slow
+
+    def test_async_late_panel_arrives_later(self, slow_cpu):
+        release, slow = slow_cpu
         layout = sysglance.build_layout()
-        assert layout["disk"] is not None
 
-    def test_has_proc_slot(self):
+        async def _two_ticks():
+            await sysglance.refresh_panels_async(layout, budget=0.05)
+            assert "cpu" in sysglance._inflight
+            release.set()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(_two_ticks())
+        assert layout["cpu"].renderable is slow
+        assert layout["mem"].renderable.renderable == "mem"
+
+
+# ---------------------------------------------------------------------------
+# Live dashboard collection schedule
+# ---------------------------------------------------------------------------
+
+class TestCollectionSchedule:
+    """Each panel is collected on its own interval, independent of redraws."""
+
+    def test_everything_due_at_start(self):
+        next_due = dict.fromkeys(sysglance._PANEL_INTERVALS, 0.0)
+        assert sysglance._due_panels(next_due, 100.0) == set(sysglance._PANEL_INTERVALS)
+
+    def test_slow_panels_wait_for_their_interval(self):
+        next_due = dict.fromkeys(sysglance._PANEL_INTERVALS, 0.0)
+        sysglance._due_panels(next_due, 100.0)
+        assert sysglance._due_panels(next_due, 101.0) == {
+            "header", "cpu", "mem", "net", "docker", "gpu",
+        }
+        assert "proc" in sysglance._due_panels(next_due, 102.0)
+        assert "disk" not in sysglance._due_panels(next_due, 104.0)
+        assert "disk" in sysglance._due_panels(next_due, 105.0)
+
+    def test_every_panel_scheduled(self):
         layout = sysglance.build_layout()
-        assert layout["proc"] is not None
+        names = {name for name, _ in sysglance._PSUTIL_PANELS}
+        names |= {name for name, _ in sysglance._SUBPROCESS_PANELS}
+        assert names == set(sysglance._PANEL_INTERVALS)
+        assert all(layout[name] is not None for name in names)
 
-    def test_has_net_slot(self):
+    def test_refresh_only_named_panels(self):
         layout = sysglance.build_layout()
-        assert layout["net"] is not None
+        untouched = layout["disk"].renderable
+        with _no_tools():
+            asyncio.run(sysglance.refresh_panels_async(layout, names={"header", "gpu"}))
+        assert isinstance(layout["header"].renderable, Panel)
+        assert "No GPU detected" in layout["gpu"].renderable.renderable.plain
+        assert layout["disk"].renderable is untouched
+
+    def test_live_loop_starts_docker_watcher(self):
+        class _Stop(Exception):
+            pass
+
+        with mock.patch("sysglance.Live"), \
+             mock.patch("sysglance._docker_watch_start") as start, \
+             mock.patch("sysglance.refresh_panels_async", side_effect=_Stop):
+            with pytest.raises(_Stop):
+                asyncio.run(sysglance._live_loop(sysglance.build_layout(), Console()))
+        start.assert_called_once()
 
-    def test_has_gpu_slot(self):
+
+# ---------------------------------------------------------------------------
+# Panels squeezed out by the terminal size are not collected
+# ---------------------------------------------------------------------------
+
+class TestHiddenPanels:
+    """refresh_panels should skip collectors whose region is too short."""
+
+    def _rendered(self, height):
         layout = sysglance.build_layout()
-        assert layout["gpu"] is not None
+        Console(width=120, height=height, file=io.StringIO()).print(layout)
+        return layout
 
-    def test_all_named_slots_present(self):
+    def test_everything_shown_before_first_render(self):
         layout = sysglance.build_layout()
-        expected = {"header", "cpu", "mem", "disk", "proc", "net", "gpu"}
-        for name in expected:
-            assert layout[name] is not None
+        assert all(sysglance._shown(layout, name)
+                   for name in ("cpu", "proc", "docker", "gpu"))
+
+    def test_short_terminal_hides_stacked_panels(self):
+        layout = self._rendered(height=12)
+        assert not sysglance._shown(layout, "gpu")
+        assert sysglance._shown(layout, "header")
+
+    def test_hidden_gpu_not_collected(self):
+        layout = self._rendered(height=12)
+        with _no_tools(docker="/usr/bin/docker", nvidia_smi="/usr/bin/nvidia-smi"), \
+             mock.patch("sysglance.asyncio.create_subprocess_exec") as spawn:
+            sysglance.refresh_panels(layout)
+        assert layout["gpu"].renderable is sysglance._HIDDEN
+        spawn.assert_not_called()
+
+    def test_hidden_gpu_not_collected_async(self):
+        layout = self._rendered(height=12)
+        with mock.patch("sysglance.gpu_panel_async") as gpu, \
+             mock.patch("sysglance.docker_panel_async") as docker:
+            asyncio.run(sysglance.refresh_panels_async(layout))
+        gpu.assert_not_called()
+        docker.assert_not_called()
+        assert layout["docker"].renderable is sysglance._HIDDEN
+
+    def test_tall_terminal_collects_everything(self):
+        layout = self._rendered(height=60)
+        with _no_tools():
+            sysglance.refresh_panels(layout)
+        assert isinstance(layout["gpu"].renderable, Panel)
 
 
 # ---------------------------------------------------------------------------
 # --once subprocess exit code
 # ---------------------------------------------------------------------------
 
-class TestOnceSubprocess:
-    """Running sysglance.py --once as a subprocess should exit cleanly."""
-
-    def test_once_exits_with_rc_zero(self):
-        result = subprocess.run(
-            [sys.executable, "sysglance.py", "--once"],
-            capture_output=True,
-            timeout=30,
-        )
-        assert result.returncode == 0, (
-            f"sysglance.py --once exited with rc={result.returncode}\n"
-            f"stderr: {result.stderr.decode()}"
-        )
+class TestOnce:
+    """main() with --once should print one snapshot and return 0."""
+
+    def test_once_returns_zero(self, capsys):
+        with mock.patch.object(sys, "argv", ["sysglance", "--once"]), \
+             mock.patch("sysglance.time.sleep") as sleep, \
+             _no_tools():
+            rc = sysglance.main()
+        assert rc == 0
+        sleep.assert_called_once_with(0.5)
+        assert "CPU Usage" in capsys.readouterr().out
+
+    def test_once_does_not_start_docker_watcher(self, capsys):
+        with mock.patch.object(sys, "argv", ["sysglance", "--once"]), \
+             mock.patch("sysglance.time.sleep"), \
+             mock.patch("sysglance._docker_watch_start") as start, \
+             _no_tools():
+            sysglance.main()
+        start.assert_not_called()